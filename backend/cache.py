@@ -8,6 +8,7 @@ import json
 import hashlib
 import logging
 from typing import Any, Optional
+from pydantic import BaseModel
 from redis import asyncio as aioredis
 
 logger = logging.getLogger(__name__)
@@ -112,7 +113,8 @@ class CacheService:
 
         Args:
             key: Cache key
-            value: Value to cache (must be JSON serializable)
+            value: Value to cache (JSON serializable, or a Pydantic model which
+                is encoded directly with its compiled JSON serializer)
             ttl: Time to live in seconds (default: 5 minutes)
 
         Returns:
@@ -122,7 +124,10 @@ class CacheService:
             return False
 
         try:
-            serialized = json.dumps(value)
+            if isinstance(value, BaseModel):
+                serialized = value.model_dump_json()
+            else:
+                serialized = json.dumps(value)
             await self.redis.setex(key, ttl, serialized)
             return True
         except Exception as e:
@@ -181,6 +181,11 @@ def get_port() -> int:
         return 8000
 
 
+def get_serve_static_files() -> bool:
+    """Check if the app should serve static/ itself (disable when a reverse proxy or CDN serves it)."""
+    return os.getenv('SERVE_STATIC_FILES', 'true').lower() == 'true'
+
+
 # ============================================================================
 # Configuration Validation
 # ============================================================================
@@ -290,6 +295,12 @@ CACHE_TTL_SOLD = 1800
 CACHE_TTL_ACTIVE = 300
 """Cache TTL for active listings in seconds (5 minutes)."""
 
+STATIC_CACHE_MAX_AGE = 3600
+"""Browser cache lifetime for static assets in seconds (HTML pages always revalidate via ETag)."""
+
+DEEP_LINK_CACHE_SIZE = 65536
+"""Max (item_id, marketplace) pairs kept in the in-process eBay deep link LRU cache."""
+
 
 # ============================================================================
 # FMV Calculation
@@ -308,6 +319,12 @@ MIN_ITEMS_FOR_OUTLIER_DETECTION = 4
 MIN_ITEMS_FOR_FMV = 2
 """Minimum number of items required to calculate FMV."""
 
+FMV_CACHE_SIZE = 1024
+"""Max distinct comp sets whose calculate_fmv result is kept in the in-process LRU cache."""
+
+FMV_CACHE_TTL = CACHE_TTL_SOLD
+"""Seconds a cached calculate_fmv result stays valid; matches the sold comps cache."""
+
 
 # ============================================================================
 # Price Concentration Detection
@@ -483,6 +500,9 @@ MAX_YEAR_TRENDS = 2
 HIGH_ACTIVITY_BID_THRESHOLD = 10
 """Bid count threshold for high-activity premium analysis."""
 
+CLASSIFY_TITLE_CACHE_SIZE = 65536
+"""Max distinct titles kept in the in-process classify_title LRU cache."""
+
 
 # ============================================================================
 # Collections & Binders Configuration (Phase 2)
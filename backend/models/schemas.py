@@ -5,12 +5,18 @@ Pydantic models for API requests and responses.
 This module contains all the data models used across the application,
 extracted from main.py to avoid circular imports.
 """
+from dataclasses import dataclass
 from datetime import date
 from typing import List, Optional, Dict
+
 from pydantic import BaseModel
 
 
-class Seller(BaseModel):
+# Leaf containers nested in every CompItem: plain slotted dataclasses, which
+# Pydantic still validates (and coerces) at the CompItem boundary, without
+# a full model instance per listing.
+@dataclass(slots=True)
+class Seller:
     name: Optional[str] = None
     reviews: Optional[int] = None
     positive_feedback_percent: Optional[float] = None
@@ -19,7 +25,8 @@ class Seller(BaseModel):
     thumbnail: Optional[str] = None
 
 
-class ExtractedPriceRange(BaseModel):
+@dataclass(slots=True)
+class ExtractedPriceRange:
     from_price: Optional[float] = None
     to_price: Optional[float] = None
 
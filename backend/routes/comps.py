@@ -6,6 +6,7 @@ This module contains the main search endpoints for finding comparable
 card prices from eBay's sold and active listings.
 """
 import re
+import sys
 import time
 import uuid
 from typing import Optional
@@ -43,6 +44,112 @@ limiter = Limiter(key_func=get_remote_address)
 
 _BID_PATTERN = re.compile(r'^(\d+)\s+bids?$', re.IGNORECASE)
 
+# Flags set for the legacy SearchAPI fixed-price buying_format strings (lowercased)
+_BUYING_FORMAT_FLAGS = {
+    'buy it now': {'is_auction': False, 'is_buy_it_now': True, 'is_best_offer': False},
+    'or best offer': {
+        'is_auction': False,
+        'is_buy_it_now': True,
+        'is_best_offer': True,
+        'has_best_offer': True,
+        'best_offer_enabled': True,
+    },
+}
+
+
+def _any_term_pattern(terms: list) -> re.Pattern:
+    """Compile substring terms into one alternation (same result as any(term in text))."""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+# Post-scrape title filters for /comps, each checked with a single .search()
+# over the lowercased title instead of one `in` scan per term.
+_RAW_ONLY_TITLE_RE = _any_term_pattern([
+    'psa', 'bgs', 'sgc', 'csg', 'hga', 'graded', ' grade ', 'gem mint', 'psa 10', 'bgs 9',
+])
+_BASE_ONLY_TITLE_RE = _any_term_pattern([
+    'refractor', 'prizm', 'prism', 'parallel', 'wave', 'gold', 'purple', 'blue', 'red', 'green',
+    'yellow', 'orange', 'pink', 'black', 'atomic', 'xfractor', 'superfractor', 'numbered', 'stars', 'star',
+])
+_BASE_ONLY_EXTENSIONS_RE = _any_term_pattern(['parallel', 'refractor', 'prizm', 'numbered'])
+_AUTOGRAPH_TITLE_RE = _any_term_pattern(['autograph', 'signed', 'auto card', 'auto rc', ' auto ', '/auto'])
+
+# Low-cardinality string fields ("Used", "Buy It Now", "FIXED_PRICE", ...)
+# that are interned so every item shares one string object per value.
+_INTERNED_FIELDS = ('condition', 'buying_format', 'shipping_type', 'listing_type', 'brand')
+
+
+def intern_enum_fields(item: dict) -> None:
+    """Intern enum-like string fields of a raw item in-place."""
+    for field in _INTERNED_FIELDS:
+        value = item.get(field)
+        if type(value) is str:
+            item[field] = sys.intern(value)
+
+
+def _apply_listing_filters(raw_items: list, params: QueryValidator) -> list:
+    """Apply the Raw Only / Base Only / Exclude Autographs filters to raw sold items.
+
+    Each title is lowercased once per item. Condition, authenticity and
+    extensions are only lowercased when a filter that reads them is enabled,
+    and at most once per item when several filters read the same field.
+    """
+    filtered_items = []
+    for item in raw_items:
+        title = item.get('title', '').lower()
+        # Lowercased lazily and shared by the filters that read them
+        authenticity = None
+        extensions_text = None
+
+        # Raw Only filter - check both title and condition/authenticity data
+        if params.raw_only:
+            # Filter out items with "Graded" in the condition field
+            if item.get('condition', '').lower() == 'graded':
+                logger.debug(
+                    "[RAW ONLY] Filtered graded item: %s - condition=%s",
+                    item.get('item_id'), item.get('condition'),
+                )
+                continue
+            # Check title for grading company names and specific grading terms
+            # Note: Removed 'mint' from filter as it catches legitimate ungraded "mint condition" cards
+            if _RAW_ONLY_TITLE_RE.search(title):
+                continue
+            # Check authenticity field
+            authenticity = item.get('authenticity', '').lower()
+            if 'graded' in authenticity:
+                continue
+            # Check PSA vault status
+            if item.get('is_in_psa_vault'):
+                continue
+
+        # Base Only filter - check title and extensions
+        if params.base_only:
+            if _BASE_ONLY_TITLE_RE.search(title):
+                continue
+            extensions_text = ' '.join(item.get('extensions', [])).lower()
+            if _BASE_ONLY_EXTENSIONS_RE.search(extensions_text):
+                continue
+
+        # Exclude Autographs filter - check title, authenticity, and extensions
+        if params.exclude_autographs:
+            # Note: Removed overly broad terms like 'authentic' and 'certified' which filter out non-autograph cards
+            # Only filter clear autograph indicators
+            if _AUTOGRAPH_TITLE_RE.search(title):
+                continue
+            if authenticity is None:
+                authenticity = item.get('authenticity', '').lower()
+            if 'autograph' in authenticity:
+                continue
+            # 'autograph' has no spaces, so it cannot match across joined extensions
+            if extensions_text is None:
+                extensions_text = ' '.join(item.get('extensions', [])).lower()
+            if 'autograph' in extensions_text:
+                continue
+
+        filtered_items.append(item)
+
+    return filtered_items
+
 
 def parse_buying_format(item: dict) -> None:
     """Parse the buying_format string and set auction/BIN/BO flags in-place.
@@ -60,32 +167,23 @@ def parse_buying_format(item: dict) -> None:
     """
     buying_format = (item.get('buying_format') or '').strip()
 
-    bid_match = _BID_PATTERN.match(buying_format)
-    if bid_match:
-        bid_count = int(bid_match.group(1))
-        item['is_auction'] = True
-        item['auction_sold'] = True
-        item['bids'] = bid_count
-        item['total_bids'] = bid_count
-        item['is_buy_it_now'] = False
-        item['is_best_offer'] = False
-        return
-
-    fmt_lower = buying_format.lower()
-
-    if fmt_lower == 'buy it now':
-        item['is_auction'] = False
-        item['is_buy_it_now'] = True
-        item['is_best_offer'] = False
-        return
-
-    if fmt_lower == 'or best offer':
-        item['is_auction'] = False
-        item['is_buy_it_now'] = True
-        item['is_best_offer'] = True
-        item['has_best_offer'] = True
-        item['best_offer_enabled'] = True
-        return
+    if buying_format:
+        # Fixed-price strings map straight to their flags with one dict lookup
+        flags = _BUYING_FORMAT_FLAGS.get(buying_format.lower())
+        if flags is not None:
+            item.update(flags)
+            return
+
+        bid_match = _BID_PATTERN.match(buying_format)
+        if bid_match:
+            bid_count = int(bid_match.group(1))
+            item['is_auction'] = True
+            item['auction_sold'] = True
+            item['bids'] = bid_count
+            item['total_bids'] = bid_count
+            item['is_buy_it_now'] = False
+            item['is_best_offer'] = False
+            return
 
     # Unknown or empty — preserve any existing flags as fallback
     if 'is_auction' not in item:
@@ -99,12 +197,24 @@ def parse_buying_format(item: dict) -> None:
         )
 
 
+def normalize_cache_query(query: str) -> str:
+    """Normalize a search query for cache keys (case- and whitespace-insensitive).
+
+    eBay search ignores case and extra spaces, so "Elly  De La Cruz" and
+    "elly de la cruz" return the same listings and can share a cache entry.
+    """
+    return ' '.join(query.lower().split())
+
+
 def get_cache_service(request: Request) -> CacheService:
     """Dependency to get cache service from app state."""
     return request.app.state.cache_service
 
 
-@router.get("/comps", response_model=CompsResponse)
+# Most CompItem fields are None for any given listing, so nulls are left out
+# of the JSON. This is part of the public API contract (documented in README
+# and AI_CONTEXT): clients must treat a missing key the same as null.
+@router.get("/comps", response_model=CompsResponse, response_model_exclude_none=True)
 @limiter.limit("10/minute")
 async def get_comps(
     request: Request,
@@ -150,7 +260,7 @@ async def get_comps(
 
     # Generate cache key from all query parameters
     cache_params = {
-        "query": params.query,
+        "query": normalize_cache_query(params.query),
         "pages": params.pages,
         "sort_by": params.sort_by,
         "buying_format": params.buying_format,
@@ -179,7 +289,8 @@ async def get_comps(
                 cache_key=cache_key
             )
             logger.info(f"[CACHE HIT] Returning cached data for sold listings: {params.query}")
-            return CompsResponse(**cached_response)
+            # The entry may come from a differently-cased query; echo this request's
+            return CompsResponse(**{**cached_response, "query": params.query})
 
     # Cache miss - log it
     log_with_context(
@@ -229,52 +340,8 @@ async def get_comps(
             )
 
             # Additional post-processing filtering using API data
-            filtered_items = []
-            for item in raw_items:
-                title = item.get('title', '').lower()
-                condition = item.get('condition', '').lower()
-                authenticity = item.get('authenticity', '').lower()
-                extensions = [ext.lower() for ext in item.get('extensions', [])]
-
-                # Raw Only filter - check both title and condition/authenticity data
-                if params.raw_only:
-                    # Filter out items with "Graded" in the condition field
-                    if condition == 'graded':
-                        logger.debug(f"[RAW ONLY] Filtered graded item: {item.get('item_id')} - condition={item.get('condition')}")
-                        continue
-                    # Check title for grading company names and specific grading terms
-                    # Note: Removed 'mint' from filter as it catches legitimate ungraded "mint condition" cards
-                    if any(term in title for term in ['psa', 'bgs', 'sgc', 'csg', 'hga', 'graded', ' grade ', 'gem mint', 'psa 10', 'bgs 9']):
-                        continue
-                    # Check authenticity field
-                    if 'graded' in authenticity:
-                        continue
-                    # Check PSA vault status
-                    if item.get('is_in_psa_vault'):
-                        continue
-
-                # Base Only filter - check title and extensions
-                if params.base_only:
-                    if any(term in title for term in [
-                        'refractor', 'prizm', 'prism', 'parallel', 'wave', 'gold', 'purple', 'blue', 'red', 'green',
-                        'yellow', 'orange', 'pink', 'black', 'atomic', 'xfractor', 'superfractor', 'numbered', 'stars', 'star'
-                    ]):
-                        continue
-                    if any(term in ' '.join(extensions) for term in ['parallel', 'refractor', 'prizm', 'numbered']):
-                        continue
-
-                # Exclude Autographs filter - check title, authenticity, and extensions
-                if params.exclude_autographs:
-                    # Note: Removed overly broad terms like 'authentic' and 'certified' which filter out non-autograph cards
-                    # Only filter clear autograph indicators
-                    if any(term in title for term in ['autograph', 'signed', 'auto card', 'auto rc', ' auto ', '/auto']):
-                        continue
-                    if 'autograph' in authenticity or any('autograph' in ext for ext in extensions):
-                        continue
-
-                filtered_items.append(item)
-
-            raw_items = filtered_items
+            if params.raw_only or params.base_only or params.exclude_autographs:
+                raw_items = _apply_listing_filters(raw_items, params)
 
     except APIKeyMissingError as e:
         # Log and re-raise custom exceptions
@@ -343,14 +410,18 @@ async def get_comps(
                 details={"query": params.query, "error": error_message, "correlation_id": correlation_id}
             )
 
-    # Remove duplicates based on item_id and filter out zero-price items
+    # Single pass: remove duplicates (by item_id) and zero-price items, then set
+    # buying format flags, deep link and total_price and build the CompItem
     logger.info(f"[INFO] Processing {len(raw_items)} raw items from scraper")
 
-    unique_items = []
+    comp_items = []
     seen_item_ids = set()
     duplicates_removed = 0
     zero_price_removed = 0
     no_item_id_removed = 0
+    min_price = None
+    max_price = None
+    price_sum = 0.0
 
     for idx, item in enumerate(raw_items):
         item_id = item.get('item_id')
@@ -382,44 +453,43 @@ async def get_comps(
             continue
 
         # Item passed all filters
-        unique_items.append(item)
         seen_item_ids.add(item_id)
 
-    logger.info("Data filtering results:")
-    logger.info(f"  - Raw items: {len(raw_items)}")
-    logger.info(f"  - Removed {duplicates_removed} duplicates")
-    logger.info(f"  - Removed {zero_price_removed} zero-price items")
-    logger.info(f"  - Removed {no_item_id_removed} items without item_id")
-    logger.info(f"  - Final clean items: {len(unique_items)}")
-
-    # Convert raw items to CompItems with proper buying format flags
-    comp_items = []
-    for item in unique_items:
         parse_buying_format(item)
+        intern_enum_fields(item)
 
         # Generate deep link for mobile app navigation
-        item_id = item.get('item_id')
-        if item_id:
-            logger.debug(f"[SOLD LISTING] Processing item_id: {item_id} (type: {type(item_id).__name__})")
-            item['deep_link'] = generate_ebay_deep_link(item_id)
-        else:
-            logger.warning(f"[SOLD LISTING] No item_id for item: {item.get('title', 'N/A')[:50]}")
-            item['deep_link'] = None
+        logger.debug("[SOLD LISTING] Processing item_id: %s (type: %s)", item_id, type(item_id).__name__)
+        item['deep_link'] = generate_ebay_deep_link(item_id)
 
-        comp_items.append(CompItem(**item))
+        # Validate the dict directly (no **kwargs repacking per item)
+        comp_item = CompItem.model_validate(item)
 
-    # Use total_price from data if available, otherwise calculate it
-    for item in comp_items:
-        if item.total_price is None:
-            item.total_price = (item.extracted_price or 0) + (item.extracted_shipping or 0)
+        # Use total_price from data if available, otherwise calculate it
+        if comp_item.total_price is None:
+            comp_item.total_price = (comp_item.extracted_price or 0) + (comp_item.extracted_shipping or 0)
 
-    prices = [item.total_price for item in comp_items if item.total_price is not None]
-    min_price = min(prices) if prices else None
-    max_price = max(prices) if prices else None
-    avg_price = sum(prices) / len(prices) if prices else None
+        # Running price stats, so no second pass over comp_items is needed
+        total_price = comp_item.total_price
+        if min_price is None or total_price < min_price:
+            min_price = total_price
+        if max_price is None or total_price > max_price:
+            max_price = total_price
+        price_sum += total_price
+
+        comp_items.append(comp_item)
+
+    logger.info("Data filtering results:")
+    logger.info(f"  - Raw items: {len(raw_items)}")
+    logger.info(f"  - Removed {duplicates_removed} duplicates")
+    logger.info(f"  - Removed {zero_price_removed} zero-price items")
+    logger.info(f"  - Removed {no_item_id_removed} items without item_id")
+    logger.info(f"  - Final clean items: {len(comp_items)}")
+
+    avg_price = price_sum / len(comp_items) if comp_items else None
 
     # Generate market intelligence
-    market_intelligence = analyze_market_intelligence(comp_items)
+    market_intelligence = analyze_market_intelligence(comp_items, overall_avg=avg_price)
 
     # Calculate request duration
     duration_ms = (time.time() - start_time) * 1000
@@ -459,7 +529,7 @@ async def get_comps(
     if not params.test_mode:
         cache_stored = await cache_service.set(
             cache_key,
-            response_data.dict(),
+            response_data,
             ttl=CACHE_TTL_SOLD
         )
         if cache_stored:
@@ -476,7 +546,7 @@ async def get_comps(
     return response_data
 
 
-@router.get("/active", response_model=CompsResponse)
+@router.get("/active", response_model=CompsResponse, response_model_exclude_none=True)
 @limiter.limit("10/minute")
 async def get_active_listings(
     request: Request,
@@ -516,7 +586,7 @@ async def get_active_listings(
 
     # Generate cache key from all query parameters
     cache_params = {
-        "query": params.query,
+        "query": normalize_cache_query(params.query),
         "pages": params.pages,
         "sort_by": params.sort_by,
         "buying_format": params.buying_format,
@@ -539,7 +609,8 @@ async def get_active_listings(
             cache_key=cache_key
         )
         logger.info(f"[CACHE HIT] Returning cached data for active listings: {params.query}")
-        return CompsResponse(**cached_response)
+        # The entry may come from a differently-cased query; echo this request's
+        return CompsResponse(**{**cached_response, "query": params.query})
 
     # Cache miss - log it
     log_with_context(
@@ -618,18 +689,23 @@ async def get_active_listings(
         logger.debug(f"Sample item keys from Browse API: {list(raw_items[0].keys())[:10]}")
         logger.debug(f"Sample price data: extracted_price={raw_items[0].get('extracted_price')}, price={raw_items[0].get('price')}")
 
-    unique_items = []
+    # Single pass: remove duplicates (by item_id) and zero-price items, then set
+    # buying format flags, deep link and total_price and build the CompItem
+    comp_items = []
     seen_item_ids = set()
     duplicates_removed = 0
     zero_price_removed = 0
     no_item_id_removed = 0
+    min_price = None
+    max_price = None
+    price_sum = 0.0
 
     for item in raw_items:
         item_id = item.get('item_id')
 
         if not item_id:
             no_item_id_removed += 1
-            logger.debug(f"Filtered item without item_id: title={item.get('title', 'N/A')[:50]}")
+            logger.debug("Filtered item without item_id: title=%.50s", item.get('title', 'N/A'))
             continue
 
         if item_id in seen_item_ids:
@@ -639,44 +715,46 @@ async def get_active_listings(
         extracted_price = item.get('extracted_price')
         if extracted_price is None or extracted_price <= 0:
             zero_price_removed += 1
-            logger.debug(f"Filtered zero-price item: {item_id}, price={extracted_price}, title={item.get('title', 'N/A')[:50]}")
+            logger.debug(
+                "Filtered zero-price item: %s, price=%s, title=%.50s",
+                item_id, extracted_price, item.get('title', 'N/A'),
+            )
             continue
 
-        unique_items.append(item)
         seen_item_ids.add(item_id)
 
-    logger.info("Active listings filtering results:")
-    logger.info(f"  - Raw items: {len(raw_items)}")
-    logger.info(f"  - Removed {duplicates_removed} duplicates")
-    logger.info(f"  - Removed {zero_price_removed} zero-price items")
-    logger.info(f"  - Removed {no_item_id_removed} items without item_id")
-    logger.info(f"  - Final clean items: {len(unique_items)}")
-
-    # Convert to CompItems
-    comp_items = []
-    for item in unique_items:
         parse_buying_format(item)
+        intern_enum_fields(item)
 
         # Generate deep link for mobile app navigation
-        item_id = item.get('item_id')
-        if item_id:
-            logger.debug(f"[ACTIVE LISTING] Processing item_id: {item_id} (type: {type(item_id).__name__})")
-            item['deep_link'] = generate_ebay_deep_link(item_id)
-        else:
-            logger.warning(f"[ACTIVE LISTING] No item_id for item: {item.get('title', 'N/A')[:50]}")
-            item['deep_link'] = None
+        logger.debug("[ACTIVE LISTING] Processing item_id: %s (type: %s)", item_id, type(item_id).__name__)
+        item['deep_link'] = generate_ebay_deep_link(item_id)
+
+        # Validate the dict directly (no **kwargs repacking per item)
+        comp_item = CompItem.model_validate(item)
+
+        # Use total_price from data if available, otherwise calculate it
+        if comp_item.total_price is None:
+            comp_item.total_price = (comp_item.extracted_price or 0) + (comp_item.extracted_shipping or 0)
 
-        comp_items.append(CompItem(**item))
+        # Running price stats, so no second pass over comp_items is needed
+        total_price = comp_item.total_price
+        if min_price is None or total_price < min_price:
+            min_price = total_price
+        if max_price is None or total_price > max_price:
+            max_price = total_price
+        price_sum += total_price
 
-    # Use total_price from data if available, otherwise calculate it
-    for item in comp_items:
-        if item.total_price is None:
-            item.total_price = (item.extracted_price or 0) + (item.extracted_shipping or 0)
+        comp_items.append(comp_item)
+
+    logger.info("Active listings filtering results:")
+    logger.info(f"  - Raw items: {len(raw_items)}")
+    logger.info(f"  - Removed {duplicates_removed} duplicates")
+    logger.info(f"  - Removed {zero_price_removed} zero-price items")
+    logger.info(f"  - Removed {no_item_id_removed} items without item_id")
+    logger.info(f"  - Final clean items: {len(comp_items)}")
 
-    prices = [item.total_price for item in comp_items if item.total_price is not None]
-    min_price = min(prices) if prices else None
-    max_price = max(prices) if prices else None
-    avg_price = sum(prices) / len(prices) if prices else None
+    avg_price = price_sum / len(comp_items) if comp_items else None
 
     # Calculate request duration
     duration_ms = (time.time() - start_time) * 1000
@@ -714,7 +792,7 @@ async def get_active_listings(
     # TTL = 300 seconds (5 minutes) for active listings (more volatile than sold)
     cache_stored = await cache_service.set(
         cache_key,
-        response_data.dict(),
+        response_data,
         ttl=CACHE_TTL_ACTIVE
     )
     if cache_stored:
@@ -5,6 +5,8 @@ FMV (Fair Market Value) router - handles FMV calculation and testing endpoints.
 This module contains endpoints for calculating fair market value
 from comp data and testing external API connectivity.
 """
+import asyncio
+import logging
 from typing import List, Optional
 import time
 from fastapi import APIRouter, HTTPException, Depends
@@ -58,13 +60,15 @@ def get_fmv(
     Returns:
         FmvResponse: FMV calculations and confidence metrics
     """
-    logger.debug(f"Received request with {len(items)} items")
-    if len(items) > 0:
-        logger.debug("First item sample:")
-        logger.debug(f"  item_id: {items[0].item_id}")
-        logger.debug(f"  title: {items[0].title[:50] if items[0].title else 'None'}")
-        logger.debug(f"  total_price: {items[0].total_price}")
-        logger.debug(f"  date_scraped: {items[0].date_scraped} (type: {type(items[0].date_scraped)})")
+    # Skip building the sample dump entirely unless DEBUG is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received request with %d items", len(items))
+        if len(items) > 0:
+            logger.debug("First item sample:")
+            logger.debug("  item_id: %s", items[0].item_id)
+            logger.debug("  title: %s", items[0].title[:50] if items[0].title else 'None')
+            logger.debug("  total_price: %s", items[0].total_price)
+            logger.debug("  date_scraped: %s (type: %s)", items[0].date_scraped, type(items[0].date_scraped))
 
     try:
         # Calculate base FMV from sold listings
@@ -92,6 +96,22 @@ class FmvV2Request(BaseModel):
     query: Optional[str] = None  # Search query for AI relevance scoring
 
 
+async def _score_relevance(query: Optional[str], items: Optional[List[CompItem]]) -> Optional[List[float]]:
+    """
+    Score listing relevance in the default thread pool and store each score on its item.
+
+    score_listing_relevance makes blocking LLM calls, so running it in an executor
+    keeps the event loop free and lets the sold and active sides overlap.
+    Returns None when there is no query or nothing to score.
+    """
+    if not query or not items:
+        return None
+    scores = await asyncio.get_running_loop().run_in_executor(None, score_listing_relevance, query, items)
+    for item, score in zip(items, scores):
+        item.ai_relevance_score = score
+    return scores
+
+
 @router.post("/fmv/v2", response_model=FmvResponse)
 async def get_fmv_v2(
     request: FmvV2Request,
@@ -116,18 +136,12 @@ async def get_fmv_v2(
         active_count_in = len(request.active_items or [])
         logger.info(f"[FMV v2] Request started: query='{request.query}', sold={sold_count_in}, active={active_count_in}")
 
-        # Score listing relevance if query is provided
-        sold_scores = None
-        active_scores = None
+        # Score listing relevance if query is provided (sold and active concurrently)
         t0 = time.time()
-        if request.query and request.sold_items:
-            sold_scores = score_listing_relevance(request.query, request.sold_items)
-            for item, score in zip(request.sold_items, sold_scores):
-                item.ai_relevance_score = score
-        if request.query and request.active_items:
-            active_scores = score_listing_relevance(request.query, request.active_items)
-            for item, score in zip(request.active_items, active_scores):
-                item.ai_relevance_score = score
+        sold_scores, active_scores = await asyncio.gather(
+            _score_relevance(request.query, request.sold_items),
+            _score_relevance(request.query, request.active_items),
+        )
         logger.info(f"[FMV v2] Relevance scoring: {sold_count_in} sold, {active_count_in} active in {time.time()-t0:.3f}s")
 
         # --- Print Run Estimation (before FMV so collectibility can use it) ---
@@ -38,12 +38,18 @@ def calculate_market_confidence(prices: np.ndarray, weights: np.ndarray) -> Dict
     if len(prices) < 2:
         return {"score": None, "band": "Insufficient Data", "cov": None}
 
-    weighted_mean = np.average(prices, weights=weights)
+    # Same reductions np.average performs, minus its argument checks and upcast copy
+    prices = np.asarray(prices, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    weight_sum = weights.sum()
+    weighted_mean = (prices * weights).sum() / weight_sum
     if weighted_mean <= 0:
         return {"score": None, "band": "Insufficient Data", "cov": None}
 
-    weighted_var = np.average((prices - weighted_mean) ** 2, weights=weights)
-    weighted_std = np.sqrt(weighted_var)
+    deviations = prices - weighted_mean
+    weighted_var = (deviations * deviations * weights).sum() / weight_sum
+    # Scalar result: math.sqrt skips ufunc dispatch; max() guards tiny negative FP error
+    weighted_std = math.sqrt(max(0.0, float(weighted_var)))
 
     cov = (weighted_std / weighted_mean) * 100
     score = round(100 / (1 + cov / 100))
@@ -5,11 +5,15 @@ Fair Market Value (FMV) calculation service.
 This module contains all logic for calculating volume-weighted FMV
 and related statistics for card valuations.
 """
+import copy
+import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from math import ceil
 from typing import List, Optional, Dict
 import numpy as np
-from scipy.stats import skew
 from backend.services.price_tier_service import get_price_tier
 from backend.services.analytics_score_service import (
     calculate_market_confidence,
@@ -22,6 +26,8 @@ from backend.logging_config import get_logger
 from backend.config import (
     MIN_ITEMS_FOR_OUTLIER_DETECTION,
     MIN_ITEMS_FOR_FMV,
+    FMV_CACHE_SIZE,
+    FMV_CACHE_TTL,
     AUCTION_BASE_WEIGHT,
     BUY_IT_NOW_WEIGHT,
     BEST_OFFER_WEIGHT,
@@ -50,6 +56,12 @@ from backend.config import (
 
 logger = get_logger(__name__)
 
+# Volume confidence levels, indexed by how many ratio thresholds are met
+_CONFIDENCE_LABELS = ("Low", "Medium", "High")
+
+# Serial numbering in a lowercased title ("/25", "/199"), used by is_representative_sale
+_SERIAL_NUMBER_PATTERN = re.compile(r'/(\d+)')
+
 
 @dataclass
 class ClusterResult:
@@ -198,6 +210,91 @@ def calculate_volume_weight(item: object) -> float:
     return min(max(final_weight, MIN_VOLUME_WEIGHT), MAX_VOLUME_WEIGHT)
 
 
+# Per-item inputs to the volume weight, extracted in one pass by calculate_volume_weights
+_VOLUME_WEIGHT_DTYPE = np.dtype([
+    ("auction_flag", np.bool_),
+    ("best_offer", np.bool_),
+    ("bids", np.int64),
+    ("total_bids", np.int64),
+    ("ai_score", np.float64),
+])
+
+
+def _build_weight_multiplier_table() -> np.ndarray:
+    """
+    Volume weight multiplier (before the AI relevance score and capping) for
+    every (is_auction, has_best_offer, bid_count) combination.
+
+    Bid counts at or above BID_COUNT_HIGH all get the same bonus, so the table
+    only needs BID_COUNT_HIGH + 1 bid columns; callers clip bid counts into it.
+    """
+    is_auction, best_offer, bid_count = np.meshgrid(
+        [False, True], [False, True], np.arange(BID_COUNT_HIGH + 1), indexing="ij"
+    )
+    bid_bonus = np.select(
+        [bid_count >= BID_COUNT_HIGH, bid_count >= BID_COUNT_MODERATE, bid_count >= BID_COUNT_LOW],
+        [BID_WEIGHT_HIGH, BID_WEIGHT_MODERATE, BID_WEIGHT_LOW],
+        default=0.0,
+    )
+    return np.where(
+        is_auction,
+        AUCTION_BASE_WEIGHT + bid_bonus,
+        np.where(best_offer, BEST_OFFER_WEIGHT, BUY_IT_NOW_WEIGHT),
+    )
+
+
+# Indexed as [is_auction, has_best_offer, min(bid_count, BID_COUNT_HIGH)]
+_WEIGHT_MULTIPLIER_TABLE = _build_weight_multiplier_table()
+
+
+def calculate_volume_weights(items: List[object]) -> np.ndarray:
+    """
+    Vectorized calculate_volume_weight over a list of items.
+
+    The fields the weight depends on are read into aligned arrays in a single
+    pass, then each item's multiplier is one lookup in the precomputed
+    (is_auction, has_best_offer, bid_count) table instead of per-item Python
+    branching. Returns exactly the same weights as calling
+    calculate_volume_weight on each item.
+
+    Args:
+        items: CompItem objects with auction data
+
+    Returns:
+        np.ndarray: float64 weights, one per item, in input order
+    """
+    n = len(items)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+
+    def rows():
+        for item in items:
+            ai_score = getattr(item, 'ai_relevance_score', None)
+            yield (
+                bool(item.is_auction or item.auction_sold),
+                bool(item.has_best_offer or item.best_offer_enabled),
+                item.bids or 0,
+                item.total_bids or 0,
+                1.0 if ai_score is None else ai_score,
+            )
+
+    fields = np.fromiter(rows(), dtype=_VOLUME_WEIGHT_DTYPE, count=n)
+    bids = fields["bids"]
+    total_bids = fields["total_bids"]
+
+    is_auction_listing = fields["auction_flag"] | (bids > 0) | (total_bids > 0)
+    # Same as `item.bids or item.total_bids or 0`
+    bid_count = np.where(bids != 0, bids, total_bids)
+
+    weight_multiplier = _WEIGHT_MULTIPLIER_TABLE[
+        is_auction_listing.astype(np.intp),
+        fields["best_offer"].astype(np.intp),
+        np.clip(bid_count, 0, BID_COUNT_HIGH),
+    ]
+
+    return np.clip(weight_multiplier * fields["ai_score"], MIN_VOLUME_WEIGHT, MAX_VOLUME_WEIGHT)
+
+
 def find_weighted_percentile(
     sorted_prices: np.ndarray,
     cumulative_weights: np.ndarray,
@@ -223,27 +320,66 @@ def find_weighted_percentile(
         For percentile=0.25 (25th percentile), finds the price where 25% of
         the total weight falls below it.
     """
-    target_weight = total_weight * percentile
+    return find_weighted_percentiles(sorted_prices, cumulative_weights, total_weight, [percentile])[0]
 
-    # Find the index where cumulative weight crosses the target
-    idx = np.searchsorted(cumulative_weights, target_weight)
 
-    # Handle edge cases
-    if idx == 0:
-        return sorted_prices[0]
-    elif idx >= len(sorted_prices):
-        return sorted_prices[-1]
+def find_weighted_percentiles(
+    sorted_prices: np.ndarray,
+    cumulative_weights: np.ndarray,
+    total_weight: float,
+    percentiles: List[float]
+) -> np.ndarray:
+    """
+    Find the prices at several weighted percentiles in one vectorized call.
 
-    # Interpolate between prices if needed
-    if idx < len(sorted_prices) - 1:
-        weight_before = cumulative_weights[idx - 1] if idx > 0 else 0
-        weight_at = cumulative_weights[idx]
+    All target weights are located with a single np.searchsorted, and the
+    boundary handling and interpolation of find_weighted_percentile are applied
+    element-wise with array masks.
 
-        if weight_at > weight_before:
-            ratio = (target_weight - weight_before) / (weight_at - weight_before)
-            return sorted_prices[idx - 1] + ratio * (sorted_prices[idx] - sorted_prices[idx - 1])
+    Args:
+        sorted_prices: Array of prices sorted in ascending order
+        cumulative_weights: Running sum of weights corresponding to sorted_prices
+        total_weight: Sum of all weights
+        percentiles: Target percentiles (0.0 to 1.0)
 
-    return sorted_prices[idx]
+    Returns:
+        np.ndarray: Price at each requested percentile, in the same order
+    """
+    target_weights = total_weight * np.asarray(percentiles, dtype=np.float64)
+    last = len(sorted_prices) - 1
+
+    # Find the indices where cumulative weight crosses each target
+    idx = np.searchsorted(cumulative_weights, target_weights)
+
+    # Out-of-range targets clamp to the first/last price
+    upper = np.minimum(idx, last)
+    lower = np.maximum(upper - 1, 0)
+
+    # Interpolate between prices where the crossing is strictly inside the array
+    weight_before = cumulative_weights[lower]
+    weight_at = cumulative_weights[upper]
+    interpolate = (idx > 0) & (idx < last) & (weight_at > weight_before)
+
+    ratio = (target_weights - weight_before) / np.where(interpolate, weight_at - weight_before, 1.0)
+    interpolated = sorted_prices[lower] + ratio * (sorted_prices[upper] - sorted_prices[lower])
+    return np.where(interpolate, interpolated, sorted_prices[upper])
+
+
+def _sorted_percentile(sorted_values: np.ndarray, fraction: float) -> float:
+    """
+    Linear-interpolated percentile of an already-sorted array.
+
+    Returns exactly what np.percentile(values, fraction * 100) does (same
+    virtual index and the same two-sided interpolation), but reads the two
+    neighbouring order statistics directly instead of partitioning a copy.
+    """
+    position = fraction * (len(sorted_values) - 1)
+    below = int(position)
+    t = position - below
+    lower = sorted_values[below]
+    upper = sorted_values[min(below + 1, len(sorted_values) - 1)]
+    diff = upper - lower
+    return upper - diff * (1 - t) if t >= 0.5 else lower + diff * t
 
 
 def detect_price_clusters(prices: np.ndarray) -> Optional[ClusterResult]:
@@ -290,35 +426,30 @@ def detect_price_clusters(prices: np.ndarray) -> Optional[ClusterResult]:
 
     counts, edges = np.histogram(prices, bins=bins)
 
-    # Walk bins and merge adjacent occupied bins into clusters
-    # A cluster boundary occurs at 1+ empty bins
-    clusters = []  # list of (start_edge, end_edge)
-    in_cluster = False
-    cluster_start = None
-
-    for i, count in enumerate(counts):
-        if count > 0:
-            if not in_cluster:
-                cluster_start = edges[i]
-                in_cluster = True
-            cluster_end = edges[i + 1]
-        else:
-            if in_cluster:
-                clusters.append((cluster_start, cluster_end))
-                in_cluster = False
-
-    # Close final cluster if still open
-    if in_cluster:
-        clusters.append((cluster_start, cluster_end))
+    # Merge adjacent occupied bins into clusters (a boundary is 1+ empty bins).
+    # Runs of occupied bins are found with one vectorized diff instead of a
+    # Python walk over every bin, which matters when an outlier stretches the
+    # histogram to thousands of mostly-empty bins.
+    occupied = np.concatenate(([0], (counts > 0).astype(np.int8), [0]))
+    run_edges = np.diff(occupied)
+    run_starts = np.flatnonzero(run_edges == 1)      # first occupied bin of each run
+    run_ends = np.flatnonzero(run_edges == -1)       # one past the last occupied bin
 
-    if not clusters:
+    if len(run_starts) == 0:
         return None
 
-    # For each cluster, collect actual prices and compute median
+    # For each cluster, collect actual prices and compute median. Slicing a
+    # sorted copy with searchsorted selects the same prices as the
+    # (prices >= start) & (prices <= end) mask, without a full scan per cluster.
+    sorted_prices = np.sort(prices)
+    cluster_starts = edges[run_starts]
+    cluster_ends = edges[run_ends]
+    lo_idx = np.searchsorted(sorted_prices, cluster_starts, side='left')
+    hi_idx = np.searchsorted(sorted_prices, cluster_ends, side='right')
+
     cluster_data = []  # list of (median, prices_in_cluster, start, end)
-    for start, end in clusters:
-        mask = (prices >= start) & (prices <= end)
-        cluster_prices = prices[mask]
+    for start, end, lo, hi in zip(cluster_starts, cluster_ends, lo_idx, hi_idx):
+        cluster_prices = sorted_prices[lo:hi]
         if len(cluster_prices) > 0:
             cluster_data.append((
                 float(np.median(cluster_prices)),
@@ -426,18 +557,17 @@ def is_representative_sale(item: object, q1: float, q3: float, iqr: float) -> bo
 
     # Check for rare numbered parallels (/50 or lower)
     # Look for patterns like "/50", "/25", "/10", etc.
-    import re
-    parallel_match = re.search(r'/(\d+)', title_lower)
+    parallel_match = _SERIAL_NUMBER_PATTERN.search(title_lower)
     if parallel_match:
         parallel_number = int(parallel_match.group(1))
         if parallel_number <= 50:
-            logger.debug(f"Excluding rare parallel: /{parallel_number} - {item.title[:60]}")
+            logger.debug("Excluding rare parallel: /%d - %s", parallel_number, item.title[:60])
             return False
 
     # Check for gem mint grades (PSA 10, BGS 10)
     if ('psa 10' in title_lower or 'bgs 10' in title_lower or
         'gem mint 10' in title_lower or 'pristine 10' in title_lower):
-        logger.debug(f"Excluding gem mint 10: {item.title[:60]}")
+        logger.debug("Excluding gem mint 10: %s", item.title[:60])
         return False
 
     # If it has an auto keyword AND is an extreme outlier, it might be special
@@ -449,7 +579,7 @@ def is_representative_sale(item: object, q1: float, q3: float, iqr: float) -> bo
         # If it's more than 3x the IQR above Q3, it's likely a special auto variant
         extreme_upper = q3 + 3 * iqr
         if item.total_price > extreme_upper:
-            logger.debug(f"Excluding extreme auto outlier: ${item.total_price:.2f} - {item.title[:60]}")
+            logger.debug("Excluding extreme auto outlier: $%.2f - %s", item.total_price, item.title[:60])
             return False
 
     # Otherwise, consider it representative
@@ -479,7 +609,7 @@ def calculate_robust_std(prices: np.ndarray, weights: np.ndarray, weighted_media
     abs_deviations = np.abs(prices - weighted_median)
 
     # Calculate weighted median of absolute deviations
-    sorted_indices = np.argsort(abs_deviations)
+    sorted_indices = np.argsort(abs_deviations, kind="stable")
     sorted_deviations = abs_deviations[sorted_indices]
     sorted_weights = weights[sorted_indices]
 
@@ -498,7 +628,7 @@ def calculate_robust_std(prices: np.ndarray, weights: np.ndarray, weighted_media
     # Convert MAD to std equivalent (1.4826 is the conversion factor)
     robust_std = mad * 1.4826
 
-    logger.debug(f"Robust std: ${robust_std:.2f} (MAD: ${mad:.2f})")
+    logger.debug("Robust std: $%.2f (MAD: $%.2f)", robust_std, mad)
 
     return robust_std
 
@@ -546,8 +676,8 @@ def get_active_market_floor(active_items: List) -> Optional[float]:
     # Calculate 10th percentile as market floor
     floor_price = np.percentile(active_prices, 10)
 
-    logger.debug(f"Active market floor (10th percentile): ${floor_price:.2f} "
-                 f"from {len(active_prices)} active listings")
+    logger.debug("Active market floor (10th percentile): $%.2f from %d active listings",
+                 floor_price, len(active_prices))
 
     return floor_price
 
@@ -807,7 +937,88 @@ def calculate_buyer_seller_ranges(
     }
 
 
+# calculate_fmv results keyed by every item field the calculation reads, so a
+# hit is exactly the result a fresh calculation would give. Entries are stored
+# with their insertion time and expire after FMV_CACHE_TTL. The /fmv route runs
+# in a threadpool, hence the lock.
+_fmv_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_fmv_cache_lock = threading.Lock()
+
+
+def _fmv_cache_key(items: List[object]) -> tuple:
+    """Build a hashable key from the item fields calculate_fmv depends on."""
+    return tuple(
+        (
+            item.item_id,
+            getattr(item, 'title', None),
+            item.total_price,
+            item.is_auction,
+            item.auction_sold,
+            item.bids,
+            item.total_bids,
+            item.has_best_offer,
+            item.best_offer_enabled,
+            getattr(item, 'ai_relevance_score', None),
+        )
+        for item in items
+    )
+
+
+def _freeze_fmv_result(result: FMVResult) -> None:
+    """Mark a cached result's filtered arrays read-only so hits can share them."""
+    for array in (result._filtered_prices, result._filtered_weights):
+        if array is not None:
+            array.flags.writeable = False
+
+
+def _copy_cached_fmv_result(result: FMVResult) -> FMVResult:
+    """Copy a cached result, duplicating only the fields a caller can mutate in place."""
+    clone = copy.copy(result)
+    if result.price_tier is not None:
+        clone.price_tier = dict(result.price_tier)
+    if result.analytics_scores is not None:
+        clone.analytics_scores = copy.deepcopy(result.analytics_scores)
+    cluster_result = getattr(result, '_cluster_result', None)
+    if cluster_result is not None:
+        clone._cluster_result = copy.copy(cluster_result)
+    return clone
+
+
 def calculate_fmv(items: List[object]) -> FMVResult:
+    """
+    Calculate FMV for a list of comps, reusing the result for a repeated comp set.
+
+    Repeat searches (cached /comps responses, re-running the same card) send the
+    exact same comps back for FMV; those are answered from an in-process LRU
+    cache of FMV_CACHE_SIZE entries, each valid for FMV_CACHE_TTL seconds,
+    instead of re-running the pipeline. Each call gets its own copy of the
+    result and its dicts; the filtered price/weight arrays are shared and
+    read-only.
+
+    See _calculate_fmv for the algorithm.
+    """
+    key = _fmv_cache_key(items)
+    now = time.monotonic()
+    with _fmv_cache_lock:
+        entry = _fmv_cache.get(key)
+        if entry is not None:
+            stored_at, cached = entry
+            if now - stored_at < FMV_CACHE_TTL:
+                _fmv_cache.move_to_end(key)
+                return _copy_cached_fmv_result(cached)
+            del _fmv_cache[key]
+
+    result = _calculate_fmv(items)
+    _freeze_fmv_result(result)
+
+    with _fmv_cache_lock:
+        _fmv_cache[key] = (now, result)
+        if len(_fmv_cache) > FMV_CACHE_SIZE:
+            _fmv_cache.popitem(last=False)
+    return _copy_cached_fmv_result(result)
+
+
+def _calculate_fmv(items: List[object]) -> FMVResult:
     """
     Calculate Fair Market Value (FMV) using volume weighting and outlier filtering.
 
@@ -830,34 +1041,32 @@ def calculate_fmv(items: List[object]) -> FMVResult:
         - fmv_low/high: 20th/80th weighted percentiles (core price range)
     """
     # Prepare data for volume weighting
-    price_weight_item_tuples = []
+    all_items = [item for item in items if item.total_price is not None and item.total_price > 0]
 
-    for item in items:
-        if item.total_price is None or item.total_price <= 0:
-            continue
+    if len(all_items) < MIN_ITEMS_FOR_FMV:
+        return FMVResult(count=len(all_items))
 
-        # Calculate volume weight based on auction activity
-        weight = calculate_volume_weight(item)
-        price_weight_item_tuples.append((item.total_price, weight, item))
+    # scipy.stats is imported lazily: it adds ~0.7s to worker startup
+    from scipy.stats import skew
 
-    if len(price_weight_item_tuples) < MIN_ITEMS_FOR_FMV:
-        return FMVResult(count=len(price_weight_item_tuples))
+    # Extract prices and volume weights (based on auction activity)
+    all_prices = np.fromiter((item.total_price for item in all_items), dtype=np.float64, count=len(all_items))
+    all_weights = calculate_volume_weights(all_items)
 
-    # Extract prices, weights, and items
-    all_prices = np.array([t[0] for t in price_weight_item_tuples])
-    all_weights = np.array([t[1] for t in price_weight_item_tuples])
-    all_items = [t[2] for t in price_weight_item_tuples]
+    # Sort once: the IQR quartiles and, after outlier filtering, the weighted
+    # percentiles are both read off this order
+    price_order = np.argsort(all_prices, kind="stable")
 
     # Filter outliers using adaptive IQR method with smart classification
     if len(all_prices) >= MIN_ITEMS_FOR_OUTLIER_DETECTION:
         # Calculate quartiles
-        q1 = np.percentile(all_prices, 25)
-        q3 = np.percentile(all_prices, 75)
+        sorted_all_prices = all_prices[price_order]
+        q1 = _sorted_percentile(sorted_all_prices, 0.25)
+        q3 = _sorted_percentile(sorted_all_prices, 0.75)
         iqr = q3 - q1
 
         # Adaptive IQR multiplier based on sample size and skewness
-        from scipy.stats import skew as _skew
-        raw_skewness = _skew(all_prices, axis=0)
+        raw_skewness = skew(all_prices, axis=0)
         if len(all_prices) < 10:
             iqr_mult = 2.0    # Generous — preserve data when sample is thin
         elif abs(raw_skewness) > 1.5:
@@ -869,80 +1078,77 @@ def calculate_fmv(items: List[object]) -> FMVResult:
         lower_bound = q1 - iqr_mult * iqr
         upper_bound = q3 + iqr_mult * iqr
 
-        # Smart filtering: keep items within bounds OR representative outliers
-        mask = []
+        # Smart filtering: keep items within bounds OR representative outliers.
+        # Items within bounds are always kept, so only the (few) out-of-bounds
+        # items need a per-item check.
+        mask = (all_prices >= lower_bound) & (all_prices <= upper_bound)
         excluded_items = []
 
         # Tighter bounds for relevance-based filtering
         relevance_lower = q1 - 1.0 * iqr
         relevance_upper = q3 + 1.0 * iqr
 
-        for i, price in enumerate(all_prices):
-            within_bounds = lower_bound <= price <= upper_bound
-
-            # If within bounds, always keep
-            if within_bounds:
-                mask.append(True)
+        for i in np.flatnonzero(~mask):
+            price = all_prices[i]
+            # Relevance-aware: low-relevance items outside 1.0x IQR are removed
+            # regardless of title check (catches wrong-variant items with clean titles)
+            ai_score = getattr(all_items[i], 'ai_relevance_score', None)
+            if ai_score is not None and ai_score < 0.3 and not (relevance_lower <= price <= relevance_upper):
+                title_preview = all_items[i].title[:60] if hasattr(all_items[i], 'title') else 'Unknown'
+                excluded_items.append((price, title_preview))
             else:
-                # Relevance-aware: low-relevance items outside 1.0x IQR are removed
-                # regardless of title check (catches wrong-variant items with clean titles)
-                ai_score = getattr(all_items[i], 'ai_relevance_score', None)
-                if ai_score is not None and ai_score < 0.3 and not (relevance_lower <= price <= relevance_upper):
-                    mask.append(False)
+                # Check if outlier is representative of the typical variant
+                is_representative = is_representative_sale(all_items[i], q1, q3, iqr)
+                mask[i] = is_representative
+
+                if not is_representative:
                     title_preview = all_items[i].title[:60] if hasattr(all_items[i], 'title') else 'Unknown'
                     excluded_items.append((price, title_preview))
-                else:
-                    # Check if outlier is representative of the typical variant
-                    is_representative = is_representative_sale(all_items[i], q1, q3, iqr)
-                    mask.append(is_representative)
-
-                    if not is_representative:
-                        title_preview = all_items[i].title[:60] if hasattr(all_items[i], 'title') else 'Unknown'
-                        excluded_items.append((price, title_preview))
-
-        # Convert mask to numpy array
-        mask = np.array(mask, dtype=bool)
 
-        # Apply filter
+        # Apply filter (keeping the survivors' sorted order without re-sorting)
         prices = all_prices[mask]
         weights = all_weights[mask]
+        sorted_indices = price_order[mask[price_order]]
 
         outliers_removed = len(all_prices) - len(prices)
-        logger.debug(f"IQR bounds: ${lower_bound:.2f} - ${upper_bound:.2f} (Q1: ${q1:.2f}, Q3: ${q3:.2f}, mult: {iqr_mult}x)")
+        logger.debug(
+            "IQR bounds: $%.2f - $%.2f (Q1: $%.2f, Q3: $%.2f, mult: %sx)",
+            lower_bound, upper_bound, q1, q3, iqr_mult,
+        )
         logger.info(f"Removed {outliers_removed} non-representative outliers using smart classification")
 
         # Log details of excluded items (limit to first 3 for brevity)
         if excluded_items:
             for price, title in excluded_items[:3]:
-                logger.debug(f"  Excluded: ${price:.2f} - {title}")
+                logger.debug("  Excluded: $%.2f - %s", price, title)
             if len(excluded_items) > 3:
-                logger.debug(f"  ... and {len(excluded_items) - 3} more")
+                logger.debug("  ... and %d more", len(excluded_items) - 3)
     else:
         # Not enough data for outlier detection
         prices = all_prices
         weights = all_weights
-        logger.debug(f"Skipping outlier detection (need {MIN_ITEMS_FOR_OUTLIER_DETECTION}+ items, have {len(all_prices)})")
-
-    # Calculate volume-weighted statistics
-    weighted_mean = np.average(prices, weights=weights)
+        sorted_indices = price_order
+        logger.debug(
+            "Skipping outlier detection (need %d+ items, have %d)",
+            MIN_ITEMS_FOR_OUTLIER_DETECTION, len(all_prices),
+        )
 
-    # Calculate weighted percentiles for FMV range
-    sorted_indices = np.argsort(prices)
-    sorted_prices = prices[sorted_indices]
-    sorted_weights = weights[sorted_indices]
+    # The cumulative weights feed the weighted percentiles and their last
+    # entry is the total weight for the volume-weighted mean
+    sorted_prices = all_prices[sorted_indices]
+    sorted_weights = all_weights[sorted_indices]
 
-    # Calculate cumulative weights
     cumulative_weights = np.cumsum(sorted_weights)
     total_weight = cumulative_weights[-1]
 
-    # Find weighted percentiles
-    percentile_20 = find_weighted_percentile(sorted_prices, cumulative_weights, total_weight, 0.20)
-    percentile_25 = find_weighted_percentile(sorted_prices, cumulative_weights, total_weight, 0.25)
-    percentile_75 = find_weighted_percentile(sorted_prices, cumulative_weights, total_weight, 0.75)
-    percentile_80 = find_weighted_percentile(sorted_prices, cumulative_weights, total_weight, 0.80)
+    # Calculate volume-weighted statistics
+    weighted_mean = np.dot(sorted_weights, sorted_prices) / total_weight
 
-    # Weighted median for skewness-based market value selection
-    weighted_median = find_weighted_percentile(sorted_prices, cumulative_weights, total_weight, 0.5)
+    # Find weighted percentiles (P50 is the weighted median, used for
+    # skewness-based market value selection)
+    percentile_20, percentile_25, weighted_median, percentile_75, percentile_80 = find_weighted_percentiles(
+        sorted_prices, cumulative_weights, total_weight, [0.20, 0.25, 0.50, 0.75, 0.80]
+    )
 
     # Calculate skewness to detect asymmetric distributions
     distribution_skewness = skew(prices, axis=0)
@@ -979,8 +1185,8 @@ def calculate_fmv(items: List[object]) -> FMVResult:
         patient_sale = percentile_75
         fmv_low = max(0, percentile_20)
         fmv_high = percentile_80
-        logger.debug(f"High skewness detected ({distribution_skewness:.2f})")
-        logger.debug(f"Using weighted median ${weighted_median:.2f} instead of mean ${weighted_mean:.2f}")
+        logger.debug("High skewness detected (%.2f)", distribution_skewness)
+        logger.debug("Using weighted median $%.2f instead of mean $%.2f", weighted_median, weighted_mean)
     else:
         market_value = weighted_mean
         quick_sale = max(0, percentile_25)
@@ -995,34 +1201,26 @@ def calculate_fmv(items: List[object]) -> FMVResult:
         patient_sale = market_value
 
     # Determine confidence based on high-weight sales and price volatility
-    high_weight_count = sum(1 for w in weights if w > 1.0)
+    high_weight_count = int(np.count_nonzero(weights > 1.0))
     confidence_ratio = high_weight_count / len(weights)
 
     # Calculate price volatility (coefficient of variation)
-    price_cv = np.std(prices) / np.mean(prices)
+    price_mean = prices.mean()
+    price_cv = np.std(prices) / price_mean
 
-    # Base confidence on volume
-    if confidence_ratio >= CONFIDENCE_HIGH_RATIO:
-        base_confidence = "High"
-    elif confidence_ratio >= CONFIDENCE_MEDIUM_RATIO:
-        base_confidence = "Medium"
-    else:
-        base_confidence = "Low"
+    # Base confidence on volume: each threshold met moves one level up the table
+    confidence_level = (confidence_ratio >= CONFIDENCE_MEDIUM_RATIO) + (confidence_ratio >= CONFIDENCE_HIGH_RATIO)
+    base_confidence = _CONFIDENCE_LABELS[confidence_level]
 
-    # Adjust for volatility
+    # Adjust for volatility (one level down, never below Low)
     if price_cv > 0.5:  # High volatility
-        if base_confidence == "High":
-            volume_confidence = "Medium"
-        elif base_confidence == "Medium":
-            volume_confidence = "Low"
-        else:
-            volume_confidence = base_confidence
+        volume_confidence = _CONFIDENCE_LABELS[max(confidence_level - 1, 0)]
         logger.warning(f"High volatility (CV={price_cv:.2f}) - downgrading confidence from {base_confidence} to {volume_confidence}")
     else:
         volume_confidence = base_confidence
 
     # Count items within FMV range
-    inliers = [price for price in prices if fmv_low <= price <= fmv_high]
+    inlier_count = int(np.count_nonzero((prices >= fmv_low) & (prices <= fmv_high)))
 
     logger.info(f"Volume-weighted mean: ${weighted_mean:.2f}, FMV range: ${fmv_low:.2f}-${fmv_high:.2f} (P20-P80)")
     logger.info(f"High-weight sales: {high_weight_count}/{len(weights)} ({volume_confidence} confidence)")
@@ -1039,7 +1237,7 @@ def calculate_fmv(items: List[object]) -> FMVResult:
         quick_sale=quick_sale,
         patient_sale=patient_sale,
         volume_confidence=volume_confidence,
-        count=len(inliers),
+        count=inlier_count,
         price_tier=tier_data
     )
     result._filtered_prices = prices
@@ -1113,7 +1311,7 @@ def calculate_fmv_blended(sold_items: List[object], active_items: Optional[List[
     ]
     if len(_conf_items) >= 2:
         _conf_prices = np.array([item.total_price for item in _conf_items], dtype=float)
-        _conf_weights = np.array([calculate_volume_weight(item) for item in _conf_items], dtype=float)
+        _conf_weights = calculate_volume_weights(_conf_items)
         if len(_conf_items) >= 4:
             _cq1, _cq3 = np.percentile(_conf_prices, [25, 75])
             _ciqr = _cq3 - _cq1
@@ -9,15 +9,118 @@ This module analyzes card listings to generate insights about:
 - High-activity auction premiums
 """
 import re
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+from array import array
+from functools import lru_cache
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
 from backend.config import (
     MIN_PARALLEL_SAMPLES,
     MAX_PARALLEL_PREMIUMS,
     MAX_YEAR_TRENDS,
     HIGH_ACTIVITY_BID_THRESHOLD,
+    CLASSIFY_TITLE_CACHE_SIZE,
 )
 
+# Title patterns, compiled once at import (matched against the lowercased title
+# unless noted otherwise)
+_RE_NUMBERED = re.compile(r'/(\d+)')
+_RE_AQUA_REFRACTOR = re.compile(r'aqua.*refractor')
+_RE_RAYWAVE = re.compile(r'ray\s*wave|raywave')
+_RE_XFRACTOR = re.compile(r'x[-\s]*fractor')
+_RE_GOLD_REFRACTOR = re.compile(r'gold.*refractor')
+_RE_ORANGE_REFRACTOR = re.compile(r'orange.*refractor')
+_RE_REFRACTOR = re.compile(r'refractor')
+_RE_BASE_COMMON = re.compile(r'base|common')
+_RE_PRISM = re.compile(r'prism')
+_RE_NON_BASE = re.compile(r'refractor|parallel|prism|chrome')
+
+_RE_PSA = re.compile(r'psa\s*(\d+(?:\.\d+)?)')
+_RE_BGS = re.compile(r'bgs\s*(\d+(?:\.\d+)?)')
+_RE_SGC = re.compile(r'sgc\s*(\d+(?:\.\d+)?)')
+_RE_OTHER_GRADED = re.compile(r'cgc|csg|hga|tag|gma')
+
+# Card years 2018-2025: allowed final digits after "201" / "202"
+_YEAR_DIGITS_1X = frozenset('89')
+_YEAR_DIGITS_2X = frozenset('012345')
+
+
+class TitleClassification(NamedTuple):
+    """Everything the market intelligence analysis extracts from one title."""
+    parallel_type: str
+    numbered: Optional[int]
+    grading_service: str
+    grade: Optional[float]
+    year: Optional[int]
+
+
+def _numbered_from_title(title: str) -> Optional[int]:
+    """Print run from a "/NN" token (digits are unaffected by lowercasing)."""
+    numbered_match = _RE_NUMBERED.search(title)
+    return int(numbered_match.group(1)) if numbered_match else None
+
+
+def _parallel_from_lower(title_lower: str) -> str:
+    """Parallel type ladder over an already-lowercased title."""
+    # Order matters - check specific types first
+    if _RE_AQUA_REFRACTOR.search(title_lower):
+        return "aqua_refractor"
+    elif _RE_RAYWAVE.search(title_lower):
+        return "raywave_refractor"
+    elif _RE_XFRACTOR.search(title_lower):
+        return "xfractor"
+    elif _RE_GOLD_REFRACTOR.search(title_lower):
+        return "gold_refractor"
+    elif _RE_ORANGE_REFRACTOR.search(title_lower):
+        return "orange_refractor"
+    elif _RE_REFRACTOR.search(title_lower) and not _RE_BASE_COMMON.search(title_lower):
+        return "refractor"
+    elif _RE_PRISM.search(title_lower):
+        return "prism"
+    elif _RE_BASE_COMMON.search(title_lower) or (not _RE_NON_BASE.search(title_lower)):
+        return "base"
+    else:
+        return "chrome_parallel"
+
+
+def _grading_from_lower(title_lower: str) -> Tuple[str, Optional[float]]:
+    """Grading service/grade detection over an already-lowercased title."""
+    psa_match = _RE_PSA.search(title_lower)
+    if psa_match:
+        return "psa", float(psa_match.group(1))
+
+    bgs_match = _RE_BGS.search(title_lower)
+    if bgs_match:
+        return "bgs", float(bgs_match.group(1))
+
+    sgc_match = _RE_SGC.search(title_lower)
+    if sgc_match:
+        return "sgc", float(sgc_match.group(1))
+
+    # Other grading services
+    if _RE_OTHER_GRADED.search(title_lower):
+        return "other_graded", None
+
+    return "raw", None
+
+
+def _year_from_title(title: str) -> Optional[int]:
+    """
+    Card year (2018-2025) from a title, lowercased or not.
+
+    Scans for "20" with str.find and checks the next two characters directly
+    (same first match as the regex r'20(1[8-9]|2[0-5])', without the regex engine).
+    """
+    idx = title.find('20')
+    while idx != -1:
+        decade = title[idx + 2:idx + 3]
+        digit = title[idx + 3:idx + 4]
+        if (decade == '1' and digit in _YEAR_DIGITS_1X) or (decade == '2' and digit in _YEAR_DIGITS_2X):
+            return 2000 + int(decade + digit)
+        idx = title.find('20', idx + 1)
+    return None
+
 
 def detect_parallel_type(title: str) -> Tuple[str, Optional[int]]:
     """
@@ -48,31 +151,7 @@ def detect_parallel_type(title: str) -> Tuple[str, Optional[int]]:
     if not title:
         return "unknown", None
 
-    title_lower = title.lower()
-
-    # Extract numbered parallel (/199, /99, /50, /25, etc.)
-    numbered_match = re.search(r'/(\d+)', title)
-    numbered = int(numbered_match.group(1)) if numbered_match else None
-
-    # Detect parallel types (order matters - check specific types first)
-    if re.search(r'aqua.*refractor', title_lower):
-        return "aqua_refractor", numbered
-    elif re.search(r'ray\s*wave|raywave', title_lower):
-        return "raywave_refractor", numbered
-    elif re.search(r'x[-\s]*fractor', title_lower):
-        return "xfractor", numbered
-    elif re.search(r'gold.*refractor', title_lower):
-        return "gold_refractor", numbered
-    elif re.search(r'orange.*refractor', title_lower):
-        return "orange_refractor", numbered
-    elif re.search(r'refractor', title_lower) and not re.search(r'base|common', title_lower):
-        return "refractor", numbered
-    elif re.search(r'prism', title_lower):
-        return "prism", numbered
-    elif re.search(r'base|common', title_lower) or (not re.search(r'refractor|parallel|prism|chrome', title_lower)):
-        return "base", numbered
-    else:
-        return "chrome_parallel", numbered
+    return _parallel_from_lower(title.lower()), _numbered_from_title(title)
 
 
 def detect_grading_info(title: str) -> Tuple[str, Optional[float]]:
@@ -104,28 +183,7 @@ def detect_grading_info(title: str) -> Tuple[str, Optional[float]]:
     if not title:
         return "raw", None
 
-    title_lower = title.lower()
-
-    # PSA detection
-    psa_match = re.search(r'psa\s*(\d+(?:\.\d+)?)', title_lower)
-    if psa_match:
-        return "psa", float(psa_match.group(1))
-
-    # BGS detection
-    bgs_match = re.search(r'bgs\s*(\d+(?:\.\d+)?)', title_lower)
-    if bgs_match:
-        return "bgs", float(bgs_match.group(1))
-
-    # SGC detection
-    sgc_match = re.search(r'sgc\s*(\d+(?:\.\d+)?)', title_lower)
-    if sgc_match:
-        return "sgc", float(sgc_match.group(1))
-
-    # Other grading services
-    if re.search(r'cgc|csg|hga|tag|gma', title_lower):
-        return "other_graded", None
-
-    return "raw", None
+    return _grading_from_lower(title.lower())
 
 
 def extract_card_year(title: str) -> Optional[int]:
@@ -152,13 +210,63 @@ def extract_card_year(title: str) -> Optional[int]:
         return None
 
     # Look for 4-digit years (2018-2025 range for modern cards)
-    year_match = re.search(r'20(1[8-9]|2[0-5])', title)
-    if year_match:
-        return int(year_match.group(0))
-    return None
+    return _year_from_title(title)
 
 
-def analyze_market_intelligence(items: List[object]) -> Dict:
+@lru_cache(maxsize=CLASSIFY_TITLE_CACHE_SIZE)
+def classify_title(title: str) -> TitleClassification:
+    """
+    Classify a title's parallel type, numbering, grading and year in one call.
+
+    Equivalent to calling detect_parallel_type, detect_grading_info and
+    extract_card_year, but the title is lowercased once and shared by all
+    detectors. Results are memoized per title, since the same listing titles
+    recur across pages, repeat searches and users of a worker.
+
+    Args:
+        title: Card listing title
+
+    Returns:
+        TitleClassification(parallel_type, numbered, grading_service, grade, year)
+    """
+    if not title:
+        return TitleClassification("unknown", None, "raw", None, None)
+
+    title_lower = title.lower()
+    grading_service, grade = _grading_from_lower(title_lower)
+    return TitleClassification(
+        parallel_type=_parallel_from_lower(title_lower),
+        numbered=_numbered_from_title(title_lower),
+        grading_service=grading_service,
+        grade=grade,
+        year=_year_from_title(title_lower),
+    )
+
+
+def _group_stats(keys: Sequence[Hashable], prices: Sequence[float]) -> Dict:
+    """
+    Per-group (average, count) of prices, in order of each key's first appearance.
+
+    Group sums and counts are computed in one vectorized pass with
+    np.unique + np.bincount instead of per-group Python lists.
+    """
+    if not keys:
+        return {}
+
+    unique_keys, first_index, inverse = np.unique(np.asarray(keys), return_index=True, return_inverse=True)
+    sums = np.bincount(inverse, weights=np.asarray(prices, dtype=np.float64))
+    counts = np.bincount(inverse)
+    averages = (sums / counts).tolist()
+    unique_keys = unique_keys.tolist()
+    counts = counts.tolist()
+
+    return {
+        unique_keys[i]: (averages[i], counts[i])
+        for i in np.argsort(first_index, kind='stable').tolist()
+    }
+
+
+def analyze_market_intelligence(items: List[object], overall_avg: Optional[float] = None) -> Dict:
     """
     Analyze sold listings to generate actionable market insights.
 
@@ -171,6 +279,8 @@ def analyze_market_intelligence(items: List[object]) -> Dict:
 
     Args:
         items: List of CompItem objects with title and total_price
+        overall_avg: Average total_price across items, if the caller already
+            has it (e.g. the /comps avg_price); computed here when omitted
 
     Returns:
         Dictionary with market insights including:
@@ -197,37 +307,53 @@ def analyze_market_intelligence(items: List[object]) -> Dict:
     if not items:
         return {}
 
-    # Categorize items
-    parallel_groups = defaultdict(list)
-    grading_groups = defaultdict(list)
-    year_groups = defaultdict(list)
+    # Categorize items (numeric columns in typed arrays: 8 bytes per entry
+    # instead of a boxed float, and handed to numpy without conversion)
+    prices = array('d')
+    parallel_keys = []
+    grading_keys = []
+    years = array('l')
+    year_prices = array('d')
+    # Auctions with lots of bids, collected in the same pass
+    high_activity_prices = []
 
     for item in items:
-        if not item.title or not item.total_price or item.total_price <= 0:
+        if not item.total_price:
+            continue
+        if (item.bids or item.total_bids or 0) >= HIGH_ACTIVITY_BID_THRESHOLD:
+            high_activity_prices.append(item.total_price)
+        if not item.title or item.total_price <= 0:
             continue
 
+        classification = classify_title(item.title)
+        prices.append(item.total_price)
+
         # Parallel analysis
-        parallel_type, numbered = detect_parallel_type(item.title)
-        parallel_groups[parallel_type].append(item.total_price)
+        parallel_keys.append(classification.parallel_type)
 
         # Grading analysis
-        grading_service, grade = detect_grading_info(item.title)
-        grading_key = f"{grading_service}_{int(grade) if grade else 'ungraded'}"
-        grading_groups[grading_key].append(item.total_price)
+        grade = classification.grade
+        grading_keys.append(f"{classification.grading_service}_{int(grade) if grade else 'ungraded'}")
 
         # Year analysis
-        year = extract_card_year(item.title)
-        if year:
-            year_groups[year].append(item.total_price)
+        if classification.year:
+            years.append(classification.year)
+            year_prices.append(item.total_price)
+
+    # Groups need MIN_PARALLEL_SAMPLES prices and trends need two years, so
+    # smaller samples can skip the grouping work entirely
+    if len(prices) >= MIN_PARALLEL_SAMPLES:
+        parallel_stats = _group_stats(parallel_keys, prices)
+        grading_stats = _group_stats(grading_keys, prices)
+    else:
+        parallel_stats = grading_stats = {}
+    year_stats = _group_stats(years, year_prices) if len(years) >= 2 else {}
 
     # Calculate averages and insights
     insights = {}
 
-    # Parallel insights
-    parallel_avgs = {}
-    for parallel_type, prices in parallel_groups.items():
-        if len(prices) >= MIN_PARALLEL_SAMPLES:  # Need at least 2 prices for meaningful average
-            parallel_avgs[parallel_type] = sum(prices) / len(prices)
+    # Parallel insights (need at least 2 prices for meaningful average)
+    parallel_avgs = {k: avg for k, (avg, count) in parallel_stats.items() if count >= MIN_PARALLEL_SAMPLES}
 
     # Calculate premiums vs base cards
     base_avg = parallel_avgs.get('base', 0)
@@ -240,10 +366,7 @@ def analyze_market_intelligence(items: List[object]) -> Dict:
         insights['parallel_premiums'] = premiums[:MAX_PARALLEL_PREMIUMS]  # Top 3 premiums
 
     # Grading insights
-    grading_avgs = {}
-    for grading_key, prices in grading_groups.items():
-        if len(prices) >= MIN_PARALLEL_SAMPLES:
-            grading_avgs[grading_key] = sum(prices) / len(prices)
+    grading_avgs = {k: avg for k, (avg, count) in grading_stats.items() if count >= MIN_PARALLEL_SAMPLES}
 
     raw_avg = grading_avgs.get('raw_ungraded', 0)
     psa10_avg = grading_avgs.get('psa_10', 0)
@@ -252,15 +375,15 @@ def analyze_market_intelligence(items: List[object]) -> Dict:
         insights['grading_premium'] = f"PSA 10: {grading_multiplier:.1f}x Raw Card Premium"
 
     # Year-over-year insights
-    if len(year_groups) >= 2:
+    if len(year_stats) >= 2:
         year_trends = []
-        sorted_years = sorted(year_groups.keys())
+        sorted_years = sorted(year_stats.keys())
         for i in range(1, len(sorted_years)):
             prev_year = sorted_years[i-1]
             curr_year = sorted_years[i]
 
-            prev_avg = sum(year_groups[prev_year]) / len(year_groups[prev_year])
-            curr_avg = sum(year_groups[curr_year]) / len(year_groups[curr_year])
+            prev_avg = year_stats[prev_year][0]
+            curr_avg = year_stats[curr_year][0]
 
             if prev_avg > 0:
                 change_pct = ((curr_avg - prev_avg) / prev_avg) * 100
@@ -270,24 +393,19 @@ def analyze_market_intelligence(items: List[object]) -> Dict:
         insights['year_trends'] = year_trends[:MAX_YEAR_TRENDS]  # Top 2 trends
 
     # High-activity insights (auctions with lots of bids)
-    high_activity_prices = []
-    for item in items:
-        bid_count = item.bids or item.total_bids or 0
-        if bid_count >= HIGH_ACTIVITY_BID_THRESHOLD and item.total_price:
-            high_activity_prices.append(item.total_price)
-
-    if high_activity_prices and len([item for item in items if item.total_price]) > 0:
-        all_prices = [item.total_price for item in items if item.total_price]
+    if high_activity_prices:
+        if overall_avg is None:
+            all_prices = [item.total_price for item in items if item.total_price]
+            overall_avg = sum(all_prices) / len(all_prices)
         high_activity_avg = sum(high_activity_prices) / len(high_activity_prices)
-        overall_avg = sum(all_prices) / len(all_prices)
         if overall_avg > 0:
             activity_premium = ((high_activity_avg - overall_avg) / overall_avg) * 100
             insights['activity_premium'] = f"High-Bid Auctions ({HIGH_ACTIVITY_BID_THRESHOLD}+): +{activity_premium:.0f}% Above Average"
 
     # Summary stats
-    insights['parallel_breakdown'] = {k: f"${v:.2f} avg ({len(parallel_groups[k])} items)"
+    insights['parallel_breakdown'] = {k: f"${v:.2f} avg ({parallel_stats[k][1]} items)"
                                     for k, v in parallel_avgs.items()}
-    insights['grading_breakdown'] = {k: f"${v:.2f} avg ({len(grading_groups[k])} items)"
+    insights['grading_breakdown'] = {k: f"${v:.2f} avg ({grading_stats[k][1]} items)"
                                    for k, v in grading_avgs.items()}
 
     return insights
@@ -61,9 +61,12 @@ def load_detailed_print_runs() -> dict[str, dict]:
     return _DETAILED_CACHE
 
 
+_YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+
 def _extract_year(text: str) -> Optional[int]:
     """Extract a 4-digit year (1900-2099) from a string."""
-    match = re.search(r'\b(19\d{2}|20\d{2})\b', text)
+    match = _YEAR_PATTERN.search(text)
     return int(match.group(1)) if match else None
 
 
@@ -106,37 +109,49 @@ def _detect_set(text: str) -> Optional[str]:
     return None
 
 
+# Specific insert/variant names checked against the search query, in priority order
+_QUERY_VARIANT_PATTERNS: list[tuple[re.Pattern, str]] = [
+    (re.compile(r"museum\s*collection"), "museum_collection"),
+    (re.compile(r"museum"), "museum"),
+    (re.compile(r"stained[\s-]*glass"), "stained_glass"),
+    (re.compile(r"hit\s+parade"), "hit_parade"),
+    (re.compile(r"nucleus"), "nucleus"),
+    (re.compile(r"rainbow[\s_]*foil"), "rainbow_foil"),
+    (re.compile(r"chrome\s+refractor"), "chrome_refractor"),
+    (re.compile(r"aqua.*refractor"), "aqua_refractor"),
+    (re.compile(r"gold.*refractor"), "gold_refractor"),
+    (re.compile(r"orange.*refractor"), "orange_refractor"),
+    (re.compile(r"red.*refractor"), "red_refractor"),
+    (re.compile(r"x[-\s]*fractor"), "xfractor"),
+    (re.compile(r"refractor"), "refractor"),
+    (re.compile(r"superfractor"), "superfractor"),
+    (re.compile(r"chrome"), "chrome"),
+    (re.compile(r"\bgold\b"), "gold"),
+]
+
+
 def _detect_variant_from_query(query: str) -> Optional[str]:
     """Detect variant/insert type from the search query itself."""
     q = query.lower()
-    # Check for specific insert/variant names
-    variant_patterns = [
-        (r"museum\s*collection", "museum_collection"),
-        (r"museum", "museum"),
-        (r"stained[\s-]*glass", "stained_glass"),
-        (r"hit\s+parade", "hit_parade"),
-        (r"nucleus", "nucleus"),
-        (r"rainbow[\s_]*foil", "rainbow_foil"),
-        (r"chrome\s+refractor", "chrome_refractor"),
-        (r"aqua.*refractor", "aqua_refractor"),
-        (r"gold.*refractor", "gold_refractor"),
-        (r"orange.*refractor", "orange_refractor"),
-        (r"red.*refractor", "red_refractor"),
-        (r"x[-\s]*fractor", "xfractor"),
-        (r"refractor", "refractor"),
-        (r"superfractor", "superfractor"),
-        (r"chrome", "chrome"),
-        (r"\bgold\b", "gold"),
-    ]
-    for pattern, variant in variant_patterns:
-        if re.search(pattern, q):
+    for pattern, variant in _QUERY_VARIANT_PATTERNS:
+        if pattern.search(q):
             return variant
     return None
 
 
+# Patterns for variant-name and fuzzy-match normalization, compiled once at import
+_NON_ALNUM_PATTERN = re.compile(r'[^a-z0-9]+')
+_EXCLUDED_PHRASE_PATTERN = re.compile(r'(?:^|\s)-"[^"]*"')
+_EXCLUDED_WORD_PATTERN = re.compile(r'(?<=\s)-\S+')
+_LEADING_EXCLUDED_WORD_PATTERN = re.compile(r'^-\S+')
+_PLURAL_PATTERN = re.compile(r'\b(\w{3,})s\b')
+_AUTOGRAPH_PATTERN = re.compile(r'\bautograph\b')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 def _normalize_variant(text: str) -> str:
     """Normalize a variant name for matching."""
-    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+    return _NON_ALNUM_PATTERN.sub('_', text.lower()).strip('_')
 
 
 def _normalize_for_matching(text: str) -> str:
@@ -151,17 +166,17 @@ def _normalize_for_matching(text: str) -> str:
     # Remove eBay exclusion terms (-word, -"phrase")
     # Only match exclusions preceded by whitespace or at start of string,
     # so hyphenated words like "x-fractor" are preserved.
-    t = re.sub(r'(?:^|\s)-"[^"]*"', ' ', t)
-    t = re.sub(r'(?<=\s)-\S+', ' ', t)
-    t = re.sub(r'^-\S+', ' ', t)
+    t = _EXCLUDED_PHRASE_PATTERN.sub(' ', t)
+    t = _EXCLUDED_WORD_PATTERN.sub(' ', t)
+    t = _LEADING_EXCLUDED_WORD_PATTERN.sub(' ', t)
     # Remove remaining quotes
     t = t.replace('"', ' ')
     # Remove trailing 's' from words (simple depluralize)
-    t = re.sub(r'\b(\w{3,})s\b', r'\1', t)
+    t = _PLURAL_PATTERN.sub(r'\1', t)
     # 'autograph' -> 'auto' (so 'auto' in query matches 'autograph' in candidate)
-    t = re.sub(r'\bautograph\b', 'auto', t)
+    t = _AUTOGRAPH_PATTERN.sub('auto', t)
     # Collapse whitespace
-    t = re.sub(r'\s+', ' ', t).strip()
+    t = _WHITESPACE_PATTERN.sub(' ', t).strip()
     return t
 
 
@@ -13,6 +13,10 @@ confidence, computed from the sold listings directly.
 An analytics supplement can be written via append_analytics_snapshot(),
 called from the /api/dev/analytics-snapshot endpoint once the frontend
 has computed market pressure, liquidity, and absorption ratios.
+
+Alongside each sold pair, a small pointer file records the newest log name:
+  search_logs/sold_{sanitized_query}.latest
+so the snapshot lookup does not have to glob and sort the whole directory.
 """
 import csv
 import json
@@ -22,7 +26,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from backend.models.schemas import CompsResponse
+from backend.models.schemas import CompItem, CompsResponse
 from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +34,9 @@ logger = get_logger(__name__)
 # Project root / search_logs directory
 SEARCH_LOGS_DIR = Path(__file__).resolve().parents[2] / "search_logs"
 
+# Write buffer for the per-search CSV (one flush for a typical result set)
+CSV_WRITE_BUFFER_SIZE = 1 << 16
+
 # CSV columns written for each listing
 SOLD_CSV_FIELDS = [
     "item_id",
@@ -79,6 +86,36 @@ def _sanitize(query: str, max_len: int = 40) -> str:
     return slug[:max_len]
 
 
+def _latest_sold_pointer_path(slug: str) -> Path:
+    """Path of the pointer file naming the newest sold log for a query."""
+    return SEARCH_LOGS_DIR / f"sold_{slug}.latest"
+
+
+def _find_latest_sold_log(slug: str) -> Optional[Path]:
+    """
+    Return the newest sold log JSON for a query slug.
+
+    Reads the .latest pointer written by save_search(); falls back to
+    scanning the directory when the pointer is missing or stale (e.g. logs
+    written before pointers existed).
+    """
+    try:
+        name = _latest_sold_pointer_path(slug).read_text(encoding="utf-8").strip()
+    except OSError:
+        name = ""
+    if name:
+        latest = SEARCH_LOGS_DIR / name
+        if latest.exists():
+            return latest
+
+    pattern = f"sold_{slug}_*.json"
+    matches = sorted(
+        (p for p in SEARCH_LOGS_DIR.glob(pattern) if "_analytics" not in p.name),
+        reverse=True,
+    )
+    return matches[0] if matches else None
+
+
 def _compute_market_confidence(response: CompsResponse) -> Optional[float]:
     """
     Market confidence: how consistent are the sold prices?
@@ -117,16 +154,22 @@ def _compute_fmv_inline(response: CompsResponse) -> dict:
 
 def _write_csv(path: Path, items: list, fields: list) -> None:
     """Write a flat CSV summary from a list of CompItem objects."""
-    with path.open("w", newline="", encoding="utf-8") as f:
+    # Only dump the model fields the CSV needs (seller is flattened below)
+    include = {field for field in fields if field in CompItem.model_fields} | {"seller"}
+
+    rows = []
+    for item in items:
+        row = item.model_dump(mode="json", include=include)
+        seller = row.get("seller") or {}
+        row["seller_name"] = seller.get("name")
+        row["seller_positive_feedback_percent"] = seller.get("positive_feedback_percent")
+        row["seller_is_top_rated_plus"] = seller.get("is_top_rated_plus")
+        rows.append(row)
+
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as f:
         writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
         writer.writeheader()
-        for item in items:
-            row = item.model_dump(mode="json")
-            seller = row.get("seller") or {}
-            row["seller_name"] = seller.get("name")
-            row["seller_positive_feedback_percent"] = seller.get("positive_feedback_percent")
-            row["seller_is_top_rated_plus"] = seller.get("is_top_rated_plus")
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 def save_search(endpoint: str, response: CompsResponse) -> Path:
@@ -235,6 +278,10 @@ def save_search(endpoint: str, response: CompsResponse) -> Path:
     fields = SOLD_CSV_FIELDS if endpoint == "sold" else ACTIVE_CSV_FIELDS
     _write_csv(csv_path, response.items, fields)
 
+    # Only the sold log is looked up later (append_analytics_snapshot)
+    if endpoint == "sold":
+        _latest_sold_pointer_path(slug).write_text(json_path.name, encoding="utf-8")
+
     logger.info(f"Saved: {json_path.name}  ({len(response.items)} items)")
     return json_path
 
@@ -254,19 +301,11 @@ def append_analytics_snapshot(query: str, snapshot: dict) -> bool:
     Returns:
         True if a matching log was found and updated, False otherwise.
     """
-    slug = _sanitize(query)
-    pattern = f"sold_{slug}_*.json"
-    matches = sorted(
-        (p for p in SEARCH_LOGS_DIR.glob(pattern) if "_analytics" not in p.name),
-        reverse=True,
-    )
-
-    if not matches:
+    latest = _find_latest_sold_log(_sanitize(query))
+    if latest is None:
         logger.warning(f"No sold log found for query: {query}")
         return False
 
-    latest = matches[0]
-
     # Write supplementary analytics file alongside the original
     snapshot_path = latest.with_name(latest.stem + "_analytics.json")
     with snapshot_path.open("w", encoding="utf-8") as f:
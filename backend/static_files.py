@@ -0,0 +1,128 @@
+"""
+In-memory static file serving for the Kuya Comps UI.
+
+The static/ directory is small and only changes on deploy, so every file is
+read once at startup into a table of {relative_path: StaticAsset}. Requests
+are then answered from memory with a precomputed ETag, skipping the per-request
+stat()/open() calls done by Starlette's StaticFiles. Conditional requests
+(If-None-Match) get a bodiless 304. Range requests are handed to StaticFiles,
+whose FileResponse answers them with 206 partial content.
+
+Anything not in the table (directory redirects, 404.html fallback, files added
+after startup) is delegated to the regular StaticFiles implementation.
+"""
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass
+from email.utils import formatdate
+from typing import Dict, Optional
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from backend.config import STATIC_CACHE_MAX_AGE
+from backend.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """A static file held in memory with its precomputed validators."""
+    content: bytes
+    etag: str
+    last_modified: str
+    media_type: str
+
+
+def _build_asset(full_path: str) -> StaticAsset:
+    """Read a file and compute its ETag/Last-Modified headers."""
+    with open(full_path, "rb") as f:
+        content = f.read()
+    etag = '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+    last_modified = formatdate(os.stat(full_path).st_mtime, usegmt=True)
+    media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+    return StaticAsset(content=content, etag=etag, last_modified=last_modified, media_type=media_type)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (may be a list, '*', or weak validators)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles variant that serves a precomputed in-memory table of assets."""
+
+    def __init__(self, *, directory: str, html: bool = False, max_age: int = STATIC_CACHE_MAX_AGE):
+        super().__init__(directory=directory, html=html)
+        self.max_age = max_age
+        self.assets: Dict[str, StaticAsset] = self._load_assets(directory)
+
+    @staticmethod
+    def _load_assets(directory: str) -> Dict[str, StaticAsset]:
+        """Walk the static directory once and load every file into memory."""
+        assets: Dict[str, StaticAsset] = {}
+        total_bytes = 0
+        for root, _dirs, files in os.walk(directory):
+            for filename in files:
+                full_path = os.path.join(root, filename)
+                rel_path = os.path.normpath(os.path.relpath(full_path, directory))
+                try:
+                    asset = _build_asset(full_path)
+                except OSError as e:
+                    logger.warning(f"[STATIC] Could not preload {full_path}: {e}")
+                    continue
+                assets[rel_path] = asset
+                total_bytes += len(asset.content)
+        logger.info(f"[STATIC] Preloaded {len(assets)} static files ({total_bytes / 1024:.0f} KB) from {directory}")
+        return assets
+
+    def _lookup(self, path: str, scope: Scope) -> Optional[StaticAsset]:
+        """Resolve a request path to a preloaded asset (including directory index.html)."""
+        asset = self.assets.get(path)
+        if asset is not None:
+            return asset
+        # Directory URL in HTML mode: serve index.html only when the URL already
+        # ends in "/" — otherwise StaticFiles issues the trailing-slash redirect.
+        if self.html and scope["path"].endswith("/"):
+            return self.assets.get(os.path.normpath(os.path.join(path, "index.html")))
+        return None
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        asset = self._lookup(path, scope)
+        if asset is None:
+            return await super().get_response(path, scope)
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"range":
+                # Partial content (206/416) is left to FileResponse
+                return await super().get_response(path, scope)
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+
+        cache_control = "no-cache" if asset.media_type == "text/html" else f"public, max-age={self.max_age}"
+        headers = {
+            "etag": asset.etag,
+            "last-modified": asset.last_modified,
+            "cache-control": cache_control,
+            "accept-ranges": "bytes",
+        }
+
+        if if_none_match is not None and _etag_matches(if_none_match, asset.etag):
+            return Response(status_code=304, headers=headers)
+
+        return Response(asset.content, media_type=asset.media_type, headers=headers)
@@ -5,14 +5,33 @@ Utility functions shared across the application.
 This module contains utility functions extracted from main.py
 to avoid circular imports.
 """
-import csv
+import math
 import os
+from functools import lru_cache
 from typing import List, Dict
-from backend.config import EBAY_ROTATION_IDS
-from backend.logging_config import get_logger
 
+from backend.config import EBAY_ROTATION_IDS, DEEP_LINK_CACHE_SIZE
+from backend.logging_config import get_logger
 logger = get_logger(__name__)
 
+# Columns of testing/comps.csv (missing ones are treated as empty)
+_TEST_CSV_COLUMNS = [
+    'Title', 'Item ID', 'URL', 'Subtitle', 'Listing Type', 'Price', 'Shipping Price',
+    'Shipping Type', 'Best Offer Enabled', 'Has Best Offer', 'Sold Price', 'End Time',
+    'Auction Sold', 'Total Bids', 'Sold',
+]
+_TEST_CSV_BOOL_COLUMNS = ('Best Offer Enabled', 'Has Best Offer', 'Auction Sold', 'Sold')
+# Deletes "$" and "," from price strings in one pass
+_STRIP_CURRENCY = str.maketrans('', '', '$,')
+
+# Deep link URL templates per marketplace, built once at import since the
+# rotation IDs are fixed. Only the item ID is filled in per call.
+_DEEP_LINK_TEMPLATE = "https://www.ebay.{marketplace}/itm/{{}}?mkevt=1&mkcid=1&mkrid={mkrid}&customid=kuyacomps"
+_DEEP_LINK_TEMPLATES = {
+    marketplace: _DEEP_LINK_TEMPLATE.format(marketplace=marketplace, mkrid=mkrid)
+    for marketplace, mkrid in EBAY_ROTATION_IDS.items()
+}
+
 
 def generate_ebay_deep_link(item_id: str, marketplace: str = "com") -> str:
     """
@@ -29,26 +48,46 @@ def generate_ebay_deep_link(item_id: str, marketplace: str = "com") -> str:
     Returns:
         Full deep link URL with tracking parameters
     """
+    # Coerce before the cache so int and str IDs share an entry
+    return _cached_deep_link(str(item_id), marketplace)
+
+
+@lru_cache(maxsize=DEEP_LINK_CACHE_SIZE)
+def _cached_deep_link(item_id: str, marketplace: str) -> str:
+    """Build the deep link for an item; memoized since the same IDs recur across pages and queries."""
     # Extract numeric item ID from Browse API format (v1|ITEM_ID|0)
     # or use as-is for SearchAPI format (numeric only)
-    clean_item_id = str(item_id)
-    if '|' in clean_item_id:
-        # Parse format: v1|406480768830|0
-        parts = clean_item_id.split('|')
-        if len(parts) >= 2:
-            clean_item_id = parts[1]  # Extract the numeric ID (middle part)
-            logger.debug(f"Extracted numeric ID '{clean_item_id}' from Browse API format '{item_id}'")
+    clean_item_id = item_id
+    _, sep, rest = item_id.partition('|')
+    if sep:
+        # Parse format: v1|406480768830|0 -> the numeric ID (middle part)
+        clean_item_id = rest.partition('|')[0]
+        logger.debug("Extracted numeric ID '%s' from Browse API format '%s'", clean_item_id, item_id)
 
-    base_url = f"https://www.ebay.{marketplace}/itm/{clean_item_id}"
-    mkrid = EBAY_ROTATION_IDS.get(marketplace, EBAY_ROTATION_IDS["com"])
-    params = f"?mkevt=1&mkcid=1&mkrid={mkrid}&customid=kuyacomps"
+    template = _DEEP_LINK_TEMPLATES.get(marketplace)
+    if template is None:
+        # Unknown marketplace: keep its domain but use the .com rotation ID
+        template = _DEEP_LINK_TEMPLATE.format(marketplace=marketplace, mkrid=EBAY_ROTATION_IDS["com"])
 
-    deep_link = base_url + params
-    logger.debug(f"Generated: {deep_link}")
+    deep_link = template.format(clean_item_id)
+    logger.debug("Generated: %s", deep_link)
 
     return deep_link
 
 
+def get_deep_link_cache_stats() -> Dict:
+    """Return hit/miss statistics for the deep link LRU cache."""
+    info = _cached_deep_link.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": round(info.hits / lookups * 100, 2) if lookups > 0 else 0,
+    }
+
+
 def load_test_data() -> List[Dict]:
     """Load test data from CSV file for testing without using API tokens."""
     test_csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "testing", "comps.csv")
@@ -56,47 +95,52 @@ def load_test_data() -> List[Dict]:
     if not os.path.exists(test_csv_path):
         raise FileNotFoundError(f"Test CSV file not found at {test_csv_path}")
 
-    items = []
+    # pandas is only needed for test mode, so keep it out of worker startup
+    import pandas as pd
+
+    def parse_money(column: pd.Series) -> pd.Series:
+        """Strip "$" and "," from a price column and convert it to float (NaN if invalid)."""
+        return pd.to_numeric(column.str.translate(_STRIP_CURRENCY), errors='coerce')
+
     try:
-        with open(test_csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Convert CSV data to match the expected format
-                price_str = row.get('Price', '').replace('$', '').replace(',', '')
-                try:
-                    extracted_price = float(price_str) if price_str else None
-                except ValueError:
-                    extracted_price = None
-
-                shipping_str = row.get('Shipping Price', '').replace('$', '').replace(',', '')
-                try:
-                    extracted_shipping = float(shipping_str) if shipping_str else 0.0
-                except ValueError:
-                    extracted_shipping = 0.0
-
-                item = {
-                    'title': row.get('Title', ''),
-                    'item_id': row.get('Item ID', ''),
-                    'link': f"https://www.ebay.com/itm/{row.get('Item ID', '')}",
-                    'url': row.get('URL', ''),
-                    'subtitle': row.get('Subtitle', ''),
-                    'listing_type': row.get('Listing Type', ''),
-                    'price': row.get('Price', ''),
-                    'extracted_price': extracted_price,
-                    'shipping_price': extracted_shipping,
-                    'extracted_shipping': extracted_shipping,
-                    'shipping_type': row.get('Shipping Type', ''),
-                    'best_offer_enabled': row.get('Best Offer Enabled', '').lower() == 'true',
-                    'has_best_offer': row.get('Has Best Offer', '').lower() == 'true',
-                    'sold_price': extracted_price,  # Using price as sold_price for test data
-                    'end_time': row.get('End Time', ''),
-                    'auction_sold': row.get('Auction Sold', '').lower() == 'true',
-                    'total_bids': int(row.get('Total Bids', 0)) if row.get('Total Bids', '').isdigit() else 0,
-                    'sold': row.get('Sold', '').lower() == 'true',
-                }
-                items.append(item)
-
-        logger.info(f"Loaded {len(items)} items from test CSV")
+        # Read every column as text (empty cells stay ""), then convert whole
+        # columns at once instead of parsing cell by cell
+        df = pd.read_csv(test_csv_path, dtype=str, keep_default_na=False, encoding='utf-8')
+        df = df.reindex(columns=_TEST_CSV_COLUMNS, fill_value='')
+
+        prices = [None if math.isnan(p) else p for p in parse_money(df['Price']).tolist()]
+        shipping = parse_money(df['Shipping Price']).fillna(0.0).tolist()
+        bids = df['Total Bids']
+        total_bids = pd.to_numeric(bids.where(bids.str.isdigit(), '0')).astype(int).tolist()
+        flags = {col: (df[col].str.lower() == 'true').tolist() for col in _TEST_CSV_BOOL_COLUMNS}
+
+        items = []
+        for i, (title, item_id, url, subtitle, listing_type, price, shipping_type, end_time) in enumerate(zip(
+            df['Title'], df['Item ID'], df['URL'], df['Subtitle'], df['Listing Type'],
+            df['Price'], df['Shipping Type'], df['End Time'],
+        )):
+            items.append({
+                'title': title,
+                'item_id': item_id,
+                'link': f"https://www.ebay.com/itm/{item_id}",
+                'url': url,
+                'subtitle': subtitle,
+                'listing_type': listing_type,
+                'price': price,
+                'extracted_price': prices[i],
+                'shipping_price': shipping[i],
+                'extracted_shipping': shipping[i],
+                'shipping_type': shipping_type,
+                'best_offer_enabled': flags['Best Offer Enabled'][i],
+                'has_best_offer': flags['Has Best Offer'][i],
+                'sold_price': prices[i],  # Using price as sold_price for test data
+                'end_time': end_time,
+                'auction_sold': flags['Auction Sold'][i],
+                'total_bids': total_bids[i],
+                'sold': flags['Sold'][i],
+            })
+
+        logger.info("Loaded %d items from test CSV", len(items))
         return items
 
     except Exception as e:
@@ -51,7 +51,7 @@ class eBayBrowseClient:
         self.token = None
         self.token_expires = None
 
-        print(f"[eBay API] Initialized in {self.environment} mode")
+        logger.info("[eBay API] Initialized in %s mode", self.environment)
 
     async def get_access_token(self) -> str:
         """
@@ -279,6 +279,9 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
 
     Returns:
         Dict: Normalized item in Kuya Comps format
+
+    Per-item data-quality problems are logged at debug level only; callers
+    summarize them once per page.
     """
     # Extract item ID for logging
     item_id = ebay_item.get('itemId', 'unknown')
@@ -302,7 +305,7 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
             shipping_cost = float(shipping_obj.get('value', 0))
         except (ValueError, TypeError):
             shipping_cost = 0.0
-            print(f"[Browse API] WARNING: Item {item_id} has invalid shipping cost value")
+            logger.debug("[Browse API] Item %s has invalid shipping cost value", item_id)
         # Check for free shipping indicator
         if shipping_options[0].get('shippingCostType') == 'FREE':
             shipping_free = True
@@ -310,8 +313,10 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
     else:
         # No shipping options available in API response - this is a DATA QUALITY issue
         shipping_cost_missing = True
-        print(f"[Browse API] WARNING: Item {item_id} MISSING shippingOptions in API response - defaulting to $0.00")
-        print(f"  Title: {ebay_item.get('title', 'N/A')[:60]}")
+        logger.debug(
+            "[Browse API] Item %s MISSING shippingOptions in API response - defaulting to $0.00 (title: %s)",
+            item_id, ebay_item.get('title', 'N/A')[:60]
+        )
 
     # Extract price - Browse API returns price.value as a string
     # According to eBay docs: price is an object with 'value' (string) and 'currency' (string)
@@ -323,10 +328,10 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
                 # Convert to float, handling both string and numeric types
                 extracted_price = float(price_value)
         except (ValueError, TypeError) as e:
-            print(f"[Browse API] ERROR: Could not parse price '{price_obj.get('value')}' for item {item_id}: {e}")
+            logger.debug("[Browse API] Could not parse price '%s' for item %s: %s", price_obj.get('value'), item_id, e)
             extracted_price = 0.0
     else:
-        print(f"[Browse API] WARNING: Item {item_id} missing price object")
+        logger.debug("[Browse API] Item %s missing price object", item_id)
         extracted_price = 0.0
 
     # Determine buying format - Browse API uses buyingOptions array
@@ -347,7 +352,10 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
 
     # Debug logging for items with no price
     if extracted_price <= 0:
-        print(f"[Browse API] Warning: Item {ebay_item.get('itemId')} has zero/invalid price. Price object: {price_obj}")
+        logger.debug(
+            "[Browse API] Item %s has zero/invalid price. Price object: %s",
+            ebay_item.get('itemId'), price_obj,
+        )
 
     # Use affiliate link if available (for ePN commissions), otherwise use regular link
     # itemAffiliateWebUrl is returned when X-EBAY-C-ENDUSERCTX header includes affiliateCampaignId
@@ -356,7 +364,7 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
     # Get itemId and log if missing
     item_id_value = ebay_item.get('itemId')
     if not item_id_value:
-        print(f"[Browse API] ERROR: Item missing itemId! Title: {ebay_item.get('title', 'N/A')[:50]}")
+        logger.debug("[Browse API] Item missing itemId! Title: %s", ebay_item.get('title', 'N/A')[:50])
 
     result = {
         # Core identification - Browse API uses 'itemId' not 'item_id'
@@ -433,15 +441,24 @@ def normalize_ebay_browse_item(ebay_item: Dict) -> Dict:
 
     # Log shipping data for debugging
     if shipping_cost_missing:
-        print(f"[Browse API] SHIPPING MISSING: Item {result.get('item_id')} - total_price=${total_price_calculated:.2f} (no shipping data from eBay API)")
+        logger.debug(
+            "[Browse API] SHIPPING MISSING: Item %s - total_price=$%.2f (no shipping data from eBay API)",
+            result.get('item_id'), total_price_calculated
+        )
     elif shipping_cost > 0:
-        print(f"[Browse API] Shipping Found: Item {result.get('item_id')} - price=${extracted_price:.2f} + shipping=${shipping_cost:.2f} = total=${total_price_calculated:.2f}")
+        logger.debug(
+            "[Browse API] Shipping Found: Item %s - price=$%.2f + shipping=$%.2f = total=$%.2f",
+            result.get('item_id'), extracted_price, shipping_cost, total_price_calculated
+        )
 
     # Validation: Log items that will be filtered out
     if not result.get('item_id'):
-        print(f"[Browse API] ERROR: Item has no itemId - will be filtered. Title: {result.get('title', 'N/A')[:50]}")
+        logger.debug("[Browse API] Item has no itemId - will be filtered. Title: %s", result.get('title', 'N/A')[:50])
     elif not result.get('extracted_price') or result.get('extracted_price') <= 0:
-        print(f"[Browse API] ERROR: Item {result.get('item_id')} has zero/invalid price - will be filtered. Price obj: {price_obj}")
+        logger.debug(
+            "[Browse API] Item %s has zero/invalid price - will be filtered. Price obj: %s",
+            result.get('item_id'), price_obj,
+        )
 
     return result
 
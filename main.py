@@ -44,15 +44,17 @@ else:
 
 
 from fastapi import FastAPI, Request, Depends
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from backend.exceptions import KuyaCompsException
 from backend.cache import CacheService
+from backend.static_files import CachedStaticFiles
+from backend.utils import get_deep_link_cache_stats
 from backend.config import (
     get_redis_url,
     get_cors_origins,
     get_cors_allow_credentials,
+    get_serve_static_files,
     is_development
 )
 from backend.middleware.admin_gate import get_current_admin_required
@@ -235,13 +237,20 @@ async def get_metrics(admin: dict = Depends(get_current_admin_required)):
     - Cache hit rate
     - Error rates
     - Active requests
+    - eBay deep link LRU cache statistics
     """
-    return metrics.get_metrics_summary()
+    summary = metrics.get_metrics_summary()
+    summary["deep_link_cache"] = get_deep_link_cache_stats()
+    return summary
 
 
 # ============================================================================
 # Static File Serving (Must be last)
 # ============================================================================
 
-# Serve the UI
-app.mount("/", StaticFiles(directory="static", html=True), name="static")
+# Serve the UI from an in-memory table preloaded at startup (ETag + 304 support),
+# unless an upstream proxy/CDN serves static/ directly
+if get_serve_static_files():
+    app.mount("/", CachedStaticFiles(directory="static", html=True), name="static")
+else:
+    logger.info("[STATIC] SERVE_STATIC_FILES=false - static/ must be served by the upstream proxy")
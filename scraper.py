@@ -560,19 +560,19 @@ def scrape_active_listings(
         if price_max is not None:
             params["price_max"] = price_max
 
-        print(f"[scraper] Fetching active listings from SearchAPI (page {page})")
+        logger.info("[scraper] Fetching active listings from SearchAPI (page %d)", page)
         resp = requests.get(SEARCHAPI_BASE_URL, params=params, timeout=30)
 
         if resp.status_code != 200:
-            print(f"[scraper] SearchAPI HTTP {resp.status_code}: {resp.text[:200]}")
+            logger.error("[scraper] SearchAPI HTTP %s: %s", resp.status_code, resp.text[:200])
             break
 
         data = resp.json()
         results = data.get("organic_results", []) or []
-        print(f"[scraper] Got {len(results)} active listings on page {page}.")
+        logger.info("[scraper] Got %d active listings on page %d.", len(results), page)
 
         if not results:
-            print(f"[scraper] No results on page {page}, stopping pagination")
+            logger.info("[scraper] No results on page %d, stopping pagination", page)
             break
 
         # Track items before adding to check for potential duplicates
@@ -580,15 +580,14 @@ def scrape_active_listings(
         for r in results:
             # Debug: Log the raw buying format
             buying_format = r.get('buying_format', '')
-            print(f"[DEBUG] Raw buying_format from SearchAPI: {buying_format}")
+            logger.debug("[scraper] Raw buying_format from SearchAPI: %s", buying_format)
 
-            # Map the buying format to our display values
-            if 'auction' in buying_format.lower():
-                r['listing_type'] = 'Auction'
-            elif 'buy it now' in buying_format.lower():
-                r['listing_type'] = 'Buy It Now'
-            else:
-                r['listing_type'] = 'Buy It Now'  # Default case
+            # Lowercase once; the display type and the auction flags below both read it
+            buying_format = buying_format.lower()
+            is_auction_format = 'auction' in buying_format
+
+            # Map the buying format to our display values (anything but an auction is Buy It Now)
+            r['listing_type'] = 'Auction' if is_auction_format else 'Buy It Now'
 
             # Clean up concatenated price data from eBay sale/discount listings
             if 'price' in r and r['price'] and isinstance(r['price'], str):
@@ -603,26 +602,31 @@ def scrape_active_listings(
                         try:
                             price_clean = price_parts[0].replace(',', '')
                             r['extracted_price'] = float(price_clean)
-                            print(f"[scraper] Cleaned concatenated price: {price_str} → ${price_parts[0]} (extracted: {r['extracted_price']})")
+                            logger.debug(
+                                "[scraper] Cleaned concatenated price: %s → $%s (extracted: %s)",
+                                price_str, price_parts[0], r['extracted_price'],
+                            )
                         except ValueError:
-                            print(f"[scraper] WARNING: Could not parse cleaned price: {price_parts[0]}")
+                            logger.warning("[scraper] Could not parse cleaned price: %s", price_parts[0])
                 # Even for single prices, ensure extracted_price is set
                 elif not r.get('extracted_price'):
                     try:
                         price_clean = price_str.replace('$', '').replace(',', '')
                         r['extracted_price'] = float(price_clean)
-                        print(f"[scraper] Extracted price from single price string: {price_str} → {r['extracted_price']}")
+                        logger.debug(
+                            "[scraper] Extracted price from single price string: %s → %s",
+                            price_str, r['extracted_price'],
+                        )
                     except ValueError:
-                        print(f"[scraper] WARNING: Could not parse price string: {price_str}")
+                        logger.warning("[scraper] Could not parse price string: %s", price_str)
 
             # Check for auction indicators
-            buying_format = r.get('buying_format', '').lower()
             bids = r.get('bids', 0)
             time_left = str(r.get('time_left', '')).lower()
 
             # Set auction flag based on multiple indicators
             r['is_auction'] = (
-                'auction' in buying_format or
+                is_auction_format or
                 bids > 0 or
                 any(x in time_left for x in ['left', 'ends in', 'ending'])
             )
@@ -638,12 +642,18 @@ def scrape_active_listings(
             all_items.append(r)
 
         items_added = len(all_items) - items_before
-        print(f"[scraper] Added {items_added} active listings from page {page}. Total so far: {len(all_items)}")
+        logger.info(
+            "[scraper] Added %d active listings from page %d. Total so far: %d",
+            items_added, page, len(all_items),
+        )
 
         if page < max_pages:
             time.sleep(delay_secs)
 
-    print(f"[scraper] Completed scraping active listings. Final total: {len(all_items)} items across {page} pages")
+    logger.info(
+        "[scraper] Completed scraping active listings. Final total: %d items across %d pages",
+        len(all_items), page,
+    )
     return all_items
 
 
@@ -760,8 +770,17 @@ async def scrape_active_listings_ebay_api(
 
                 # Normalize to Kuya Comps format
                 normalized_items = []
+                missing_item_id = 0
+                invalid_price = 0
+                missing_shipping = 0
                 for item in items:
                     normalized = normalize_ebay_browse_item(item)
+                    if not normalized.get('item_id'):
+                        missing_item_id += 1
+                    elif normalized['extracted_price'] <= 0:
+                        invalid_price += 1
+                    if normalized.get('shipping_data_missing'):
+                        missing_shipping += 1
 
                     # If shipping enrichment is enabled and shipping data was MISSING (not free), fetch detailed item
                     # Only enrich if shipping_data_missing flag is True
@@ -792,6 +811,14 @@ async def scrape_active_listings_ebay_api(
 
                     normalized_items.append(normalized)
 
+                # One data-quality summary per page instead of a warning per listing
+                if missing_item_id or invalid_price or missing_shipping:
+                    logger.warning(
+                        "[eBay API] Page %d: %d items without itemId, %d with zero/invalid price, "
+                        "%d missing shippingOptions",
+                        page_num + 1, missing_item_id, invalid_price, missing_shipping,
+                    )
+
                 has_next = bool(response.get('next'))
                 logger.info(f"[eBay API] Page {page_num+1}: Processed {len(normalized_items)} items, has_next={has_next}")
 
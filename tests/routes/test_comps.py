@@ -8,11 +8,13 @@ Tests cover:
 - Cache hit/miss scenarios
 - Error handling for external service failures
 - parse_buying_format() helper
+- intern_enum_fields() helper
+- normalize_cache_query() helper
 """
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from backend.routes.comps import parse_buying_format
+from backend.routes.comps import intern_enum_fields, normalize_cache_query, parse_buying_format
 
 
 class TestParseBuyingFormat:
@@ -104,6 +106,35 @@ class TestParseBuyingFormat:
         assert item['bids'] == 20
 
 
+class TestInternEnumFields:
+    """Unit tests for intern_enum_fields() helper."""
+
+    def test_equal_values_share_one_object(self):
+        """Equal enum-like strings from different items become the same object."""
+        first = {'condition': ''.join(['Pre-', 'owned']), 'title': 'a'}
+        second = {'condition': ''.join(['Pre-own', 'ed']), 'title': 'b'}
+        assert first['condition'] is not second['condition']
+
+        intern_enum_fields(first)
+        intern_enum_fields(second)
+
+        assert first['condition'] is second['condition']
+
+    def test_ignores_missing_and_non_string_values(self):
+        """Missing or None fields are left untouched."""
+        item = {'condition': None}
+        intern_enum_fields(item)
+        assert item == {'condition': None}
+
+
+class TestNormalizeCacheQuery:
+    """Unit tests for normalize_cache_query() helper."""
+
+    def test_case_and_whitespace_variants_share_a_key(self):
+        """Queries differing only in case/spacing should normalize identically."""
+        assert normalize_cache_query("  Elly  De La\tCruz ") == "elly de la cruz"
+        assert normalize_cache_query("elly de la cruz") == "elly de la cruz"
+
 
 @pytest.mark.integration
 class TestCompsEndpoint:
@@ -0,0 +1,74 @@
+"""
+Integration tests for in-memory static file serving.
+
+Tests cover:
+- GET / serves index.html from the preloaded table
+- ETag / If-None-Match conditional requests (304)
+- Cache-Control for HTML vs. other assets
+- Unknown paths fall through to StaticFiles 404 handling
+- Range requests fall through to StaticFiles partial content
+"""
+import pytest
+
+
+@pytest.mark.integration
+class TestCachedStaticFiles:
+    """Integration tests for the CachedStaticFiles mount."""
+
+    def test_index_served_with_etag(self, test_client):
+        """Root URL should return index.html with validators."""
+        response = test_client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["etag"].startswith('"')
+        assert "last-modified" in response.headers
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_matching_etag_returns_304(self, test_client):
+        """A matching If-None-Match should return 304 with no body."""
+        etag = test_client.get("/").headers["etag"]
+
+        response = test_client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_weak_and_listed_etags_match(self, test_client):
+        """Weak validators and comma-separated lists should still match."""
+        etag = test_client.get("/").headers["etag"]
+
+        response = test_client.get("/", headers={"If-None-Match": f'"stale", W/{etag}'})
+
+        assert response.status_code == 304
+
+    def test_stale_etag_returns_full_body(self, test_client):
+        """A non-matching If-None-Match should return the full file."""
+        response = test_client.get("/", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert len(response.content) > 0
+
+    def test_non_html_asset_is_cacheable(self, test_client):
+        """Non-HTML assets get a public max-age Cache-Control."""
+        response = test_client.get("/script.js")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+    def test_missing_file_returns_404(self, test_client):
+        """Paths not in the table fall back to StaticFiles 404 handling."""
+        response = test_client.get("/definitely-not-a-real-file.js")
+
+        assert response.status_code == 404
+
+    def test_range_request_returns_partial_content(self, test_client):
+        """A Range header should get a 206 with only the requested bytes."""
+        full = test_client.get("/script.js").content
+
+        response = test_client.get("/script.js", headers={"Range": "bytes=0-9"})
+
+        assert response.status_code == 206
+        assert response.content == full[:10]
+        assert response.headers["content-range"].startswith("bytes 0-9/")
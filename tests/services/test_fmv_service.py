@@ -8,17 +8,22 @@ Tests cover:
 - Edge cases (0 items, 1 item, all same price)
 """
 import numpy as np
+import pytest
+from unittest.mock import patch
 
 from backend.services.fmv_service import (
     calculate_volume_weight,
+    calculate_volume_weights,
     find_weighted_percentile,
+    find_weighted_percentiles,
     find_value_area,
     calculate_fmv,
     calculate_fmv_blended,
     detect_price_clusters,
     calculate_buyer_seller_ranges,
     ClusterResult,
-    FMVResult
+    FMVResult,
+    _sorted_percentile,
 )
 from backend.models.schemas import CompItem
 from backend.config import (
@@ -139,6 +144,27 @@ class TestCalculateVolumeWeight:
 
         assert weight >= MIN_VOLUME_WEIGHT
 
+    def test_vectorized_weights_match_per_item(self):
+        """calculate_volume_weights should equal calculate_volume_weight per item."""
+        items = [
+            CompItem(total_price=10.0, is_auction=True, bids=20),
+            CompItem(total_price=10.0, auction_sold=True, bids=5),
+            CompItem(total_price=10.0, total_bids=3),
+            CompItem(total_price=10.0, bids=0, total_bids=12),
+            CompItem(total_price=10.0, is_buy_it_now=True),
+            CompItem(total_price=10.0, best_offer_enabled=True),
+            CompItem(total_price=10.0, is_auction=True, bids=1, ai_relevance_score=0.2),
+            CompItem(total_price=10.0, has_best_offer=True, ai_relevance_score=0.9),
+        ]
+
+        weights = calculate_volume_weights(items)
+
+        assert weights.tolist() == [calculate_volume_weight(item) for item in items]
+
+    def test_vectorized_weights_empty(self):
+        """An empty item list should give an empty weight array."""
+        assert calculate_volume_weights([]).shape == (0,)
+
 
 class TestFindWeightedPercentile:
     """Test weighted percentile calculation."""
@@ -192,6 +218,27 @@ class TestFindWeightedPercentile:
         assert result_25 == 25.0
         assert result_75 == 25.0
 
+    def test_batched_percentiles_pinned_values(self):
+        """The batched lookup should interpolate and clamp like the scalar one."""
+        prices = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+        weights = np.array([1.0, 2.0, 1.0, 3.0, 1.0])
+        cumulative_weights = np.cumsum(weights)
+        total_weight = cumulative_weights[-1]
+        percentiles = [0.0, 0.20, 0.25, 0.50, 0.75, 0.80, 1.0]
+
+        results = find_weighted_percentiles(prices, cumulative_weights, total_weight, percentiles)
+
+        np.testing.assert_allclose(results, [10.0, 13.0, 15.0, 30.0, 110.0 / 3, 38.0, 50.0])
+
+    def test_sorted_percentile_matches_numpy(self):
+        """IQR quartiles read off the sorted prices should equal np.percentile exactly."""
+        rng = np.random.default_rng(7)
+        for n in (1, 2, 3, 4, 5, 8, 13, 100):
+            prices = np.round(rng.lognormal(3, 1, n), 2)
+            sorted_prices = np.sort(prices)
+            for fraction in (0.25, 0.75):
+                assert _sorted_percentile(sorted_prices, fraction) == np.percentile(prices, fraction * 100)
+
 
 class TestCalculateFMV:
     """Test full FMV calculation including outlier filtering."""
@@ -313,6 +360,69 @@ class TestCalculateFMV:
         assert abs(result.quick_sale - 100.0) < 1.0
         assert abs(result.patient_sale - 100.0) < 1.0
 
+    def test_fmv_tied_prices_pinned(self):
+        """Tied prices keep their input order when sorted, so P25/P75 are reproducible."""
+        items = [
+            CompItem(item_id="1", title="Card 1", total_price=10.0, is_auction=False),
+            CompItem(item_id="2", title="Card 2", total_price=20.0, is_auction=True, bids=12),
+            CompItem(item_id="3", title="Card 3", total_price=20.0, is_auction=False),
+        ]
+
+        result = calculate_fmv(items)
+
+        # Interpolation into the $20 group depends on which tied sale comes first
+        assert result.quick_sale == 10.5
+        assert result.patient_sale == 19.5
+
+    def test_fmv_repeat_call_returns_independent_copy(self, sample_comp_items):
+        """A repeated comp set reuses the cached result without sharing the object."""
+        first = calculate_fmv(sample_comp_items)
+        first.quick_sale = -1.0
+
+        second = calculate_fmv(sample_comp_items)
+
+        assert second is not first
+        assert second.quick_sale != -1.0
+        assert second.to_dict() == calculate_fmv(sample_comp_items).to_dict()
+
+    def test_fmv_repeat_call_does_not_share_mutable_fields(self, sample_comp_items):
+        """Cached arrays are read-only and dicts are per-call, so hits cannot be corrupted."""
+        first = calculate_fmv(sample_comp_items)
+        first.price_tier['tier_id'] = 'corrupted'
+
+        second = calculate_fmv(sample_comp_items)
+
+        assert not second._filtered_prices.flags.writeable
+        assert not second._filtered_weights.flags.writeable
+        with pytest.raises(ValueError):
+            first._filtered_prices[0] = -1.0
+        assert second.price_tier['tier_id'] != 'corrupted'
+
+    def test_fmv_cache_entries_expire(self, sample_comp_items):
+        """An entry older than FMV_CACHE_TTL is recalculated instead of reused."""
+        first = calculate_fmv(sample_comp_items)
+
+        with patch('backend.services.fmv_service.FMV_CACHE_TTL', 0):
+            second = calculate_fmv(sample_comp_items)
+
+        assert second._filtered_prices is not first._filtered_prices
+        assert second.to_dict() == first.to_dict()
+
+    def test_fmv_cache_key_includes_weight_inputs(self):
+        """Changing a field that affects weights must not hit a stale cache entry."""
+        items = [
+            CompItem(item_id="1", title="Card 1", total_price=10.0, is_auction=False),
+            CompItem(item_id="2", title="Card 2", total_price=20.0, is_auction=True, bids=12),
+            CompItem(item_id="3", title="Card 3", total_price=20.0, is_auction=False),
+        ]
+        before = calculate_fmv(items)
+
+        items[1].bids = 0
+        items[1].is_auction = False
+        after = calculate_fmv(items)
+
+        assert after.market_value != before.market_value
+
 
 class TestFMVResult:
     """Test FMVResult data class."""
@@ -5,12 +5,14 @@ Tests cover:
 - Parallel type detection from card titles
 - Grading service and grade detection
 - Year extraction from titles
+- Combined title classification
 - Market intelligence analysis
 """
 from backend.services.intelligence_service import (
     detect_parallel_type,
     detect_grading_info,
     extract_card_year,
+    classify_title,
     analyze_market_intelligence
 )
 from backend.models.schemas import CompItem
@@ -291,6 +293,40 @@ class TestExtractCardYear:
         assert year is None
 
 
+class TestClassifyTitle:
+    """Test the combined single-call title classifier."""
+
+    def test_matches_individual_detectors(self):
+        """classify_title should agree with the three separate detectors."""
+        titles = [
+            "2024 Topps Chrome Elly De La Cruz Gold Refractor /50 PSA 10",
+            "2021 Bowman Chrome AQUA REFRACTOR /2019 BGS 9.5",
+            "2023 Topps Chrome Base Card",
+            "Topps Chrome X-Fractor SGC 9 CGC",
+            "2019 Prizm Raywave Refractor",
+        ]
+        for title in titles:
+            result = classify_title(title)
+            assert (result.parallel_type, result.numbered) == detect_parallel_type(title)
+            assert (result.grading_service, result.grade) == detect_grading_info(title)
+            assert result.year == extract_card_year(title)
+
+    def test_empty_title(self):
+        """Empty titles classify as unknown/raw with no numbering or year."""
+        result = classify_title("")
+
+        assert result == ("unknown", None, "raw", None, None)
+
+    def test_repeated_title_is_cached(self):
+        """Classifying the same title twice should reuse the cached result."""
+        title = "2022 Topps Chrome Julio Rodriguez Orange Refractor /25"
+        first = classify_title(title)
+        hits_before = classify_title.cache_info().hits
+
+        assert classify_title(title) is first
+        assert classify_title.cache_info().hits == hits_before + 1
+
+
 class TestAnalyzeMarketIntelligence:
     """Test full market intelligence analysis."""
 
@@ -360,6 +396,21 @@ class TestAnalyzeMarketIntelligence:
         assert 'activity_premium' in insights
         assert 'High-Bid Auctions' in insights['activity_premium']
 
+    def test_high_activity_premium_uses_given_overall_avg(self):
+        """A caller-supplied overall average should match the computed one."""
+        items = [
+            CompItem(item_id="1", title="Card 1", total_price=50.0, bids=2),
+            CompItem(item_id="2", title="Card 2", total_price=55.0, bids=3),
+            CompItem(item_id="3", title="Card 3", total_price=100.0, bids=15),
+            CompItem(item_id="4", title="Card 4", total_price=110.0, bids=20),
+        ]
+
+        computed = analyze_market_intelligence(items)
+        supplied = analyze_market_intelligence(items, overall_avg=78.75)
+
+        assert supplied['activity_premium'] == computed['activity_premium']
+        assert '+33%' in supplied['activity_premium']
+
     def test_parallel_breakdown_included(self):
         """Parallel breakdown with averages should be included."""
         items = [